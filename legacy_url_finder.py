@@ -47,12 +47,19 @@ completeness, the major universities in those nations are included.
 from __future__ import annotations
 
 import csv
+import dbm
 import html
+import json
 import logging
+import os
 import re
+import shelve
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -82,9 +89,27 @@ except ImportError:
     _HAVE_TQDM = False
 
 import requests
-from bs4 import BeautifulSoup  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
 from urllib.parse import quote_plus, urlparse
 
+# Prefer the C-based lxml parser for result pages; html.parser is the fallback
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+def _has_result_class(class_value: Optional[str]) -> bool:
+    """True if a class attribute includes ``result__a`` (like ``a.result__a``)."""
+    return class_value is not None and "result__a" in class_value.split()
+
+
+# Only result anchors are needed from the HTML interface, so skip building the rest of the tree.
+# A plain class_="result__a" would not match when the anchor carries other classes too
+_RESULT_LINK_STRAINER = SoupStrainer("a", class_=_has_result_class)
+
 
 # Initialize colorama on Windows for colored output
 if _HAVE_COLORAMA:
@@ -148,6 +173,95 @@ def setup_logging(log_file: Optional[str] = None, verbose: bool = False) -> logg
 # Global logger instance (will be reconfigured in main with verbose setting)
 logger = setup_logging()
 
+# Searches from all university workers share these limits: a cap on queries
+# in flight and a minimum spacing between query starts (the serial loop slept
+# 2s between searches), since rate-limited queries come back empty
+MAX_CONCURRENT_SEARCHES = 8
+SEARCH_MIN_INTERVAL = 2.0
+_SEARCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_SEARCHES)
+_search_start_lock = threading.Lock()
+_next_search_start = 0.0
+
+# Set by main on Ctrl-C so running university searches stop at their next query
+_stop_searching = threading.Event()
+
+
+class SearchStopped(Exception):
+    """Raised by _search_slot when searching has been stopped."""
+
+
+@contextmanager
+def _search_slot():
+    """Hold a search slot, waiting until the next query start is due.
+    
+    Raises
+    ------
+    SearchStopped
+        If ``_stop_searching`` is set before or while waiting.
+    """
+    global _next_search_start
+    with _SEARCH_SLOTS:
+        with _search_start_lock:
+            now = time.monotonic()
+            start = max(now, _next_search_start)
+            _next_search_start = start + SEARCH_MIN_INTERVAL
+        if _stop_searching.wait(max(0.0, start - now)):
+            raise SearchStopped()
+        yield
+
+# Universities are searched in parallel; the first wave of workers is staggered
+UNIVERSITY_WORKERS = min(32, (os.cpu_count() or 1) * 8)
+UNIVERSITY_STAGGER_SECONDS = 0.1
+
+# Search results are cached on disk so re-runs do not repeat identical queries
+SEARCH_CACHE_FILE = "ddg_search_cache"
+SEARCH_CACHE_TTL = 24 * 60 * 60
+_search_cache_lock = threading.Lock()
+
+# Detected university domains are persisted so later runs skip detection
+DOMAIN_CACHE_FILE = "university_domains.json"
+_domain_cache_lock = threading.Lock()
+
+
+def load_domain_cache(path: str = DOMAIN_CACHE_FILE) -> dict[str, str]:
+    """Load the ``{university name: domain}`` map saved by earlier runs.
+    
+    Parameters
+    ----------
+    path : str
+        JSON file to read.
+    
+    Returns
+    -------
+    dict[str, str]
+        Known domains; empty if the file is missing or unreadable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read domain cache {path}: {e}")
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str)} if isinstance(data, dict) else {}
+
+
+def save_domain_cache(path: str = DOMAIN_CACHE_FILE) -> None:
+    """Write the in-memory domain map to ``path`` (atomically)."""
+    tmp_path = f"{path}.tmp"
+    # Held across the write and replace so concurrent workers never share the temp file
+    with _domain_cache_lock:
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_domain_cache, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write domain cache {path}: {e}")
+
+
+_domain_cache: dict[str, str] = load_domain_cache()
+
 
 @dataclass
 class University:
@@ -166,10 +280,16 @@ class University:
     name: str
     country: str
     domain: Optional[str] = None
+    # Set once detection has run, so a failed lookup is not retried per URL
+    _domain_looked_up: bool = field(default=False, init=False, repr=False, compare=False)
 
     def get_domain(self) -> Optional[str]:
         """Extract or infer the university's primary domain.
         
+        At most one lookup is made per instance.  Domains detected in
+        earlier runs are read from ``DOMAIN_CACHE_FILE`` and new detections
+        are written back to it.
+        
         Returns
         -------
         Optional[str]
@@ -177,6 +297,16 @@ class University:
         """
         if self.domain:
             return self.domain
+        if self._domain_looked_up:
+            return None
+        self._domain_looked_up = True
+        
+        with _domain_cache_lock:
+            cached = _domain_cache.get(self.name)
+        if cached:
+            self.domain = cached
+            logger.debug(f"Using cached domain for {self.name}: {cached}")
+            return cached
         
         try:
             # Quick search to find the university's website
@@ -188,12 +318,10 @@ class University:
                 logger.debug("DDG not available, skipping domain detection")
                 return None
             
-            # Add delay to avoid rate limiting
-            time.sleep(0.5)
-            
             from ddgs import DDGS
             try:
-                with DDGS() as ddgs:
+                # Spaced with the other searches to avoid rate limiting
+                with _search_slot(), DDGS() as ddgs:
                     for r in ddgs.text(query, region="uk-en", max_results=3):
                         href = r.get("href", "")
                         if href:
@@ -202,8 +330,13 @@ class University:
                             # Verify it looks like a university domain
                             if domain.endswith(".ac.uk"):
                                 self.domain = domain
+                                with _domain_cache_lock:
+                                    _domain_cache[self.name] = domain
+                                save_domain_cache()
                                 logger.info(f"{Fore.GREEN}Detected domain for {self.name}: {domain}{Style.RESET_ALL}")
                                 return domain
+            except SearchStopped:
+                return None
             except Exception as search_error:
                 logger.warning(f"Search timeout during domain detection for {self.name}: {search_error}")
                 # Fall back to None, will use name-based searches
@@ -434,6 +567,51 @@ def get_universities() -> List[University]:
         return []
 
 
+def create_session() -> requests.Session:
+    """Create the shared session used for DuckDuckGo HTML scraping.
+    
+    Reusing one session keeps connections to duckduckgo.com alive across
+    queries (and threads) instead of paying DNS, TCP and TLS setup on every
+    search.
+    
+    Returns
+    -------
+    requests.Session
+        Session with a pooled adapter, retries and a browser User-Agent.
+    """
+    session = requests.Session()
+    
+    # Transient failures are retried; the last response is returned rather
+    # than raising so callers can still log the status code
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    # One connection per concurrent search is enough
+    adapter = HTTPAdapter(
+        pool_connections=MAX_CONCURRENT_SEARCHES,
+        pool_maxsize=MAX_CONCURRENT_SEARCHES,
+        max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    session.headers.update({
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/105.0.0.0 Safari/537.36"
+        )
+    })
+    return session
+
+
+_SESSION = create_session()
+
+
 def _ddg_search(query: str, max_results: int = 5) -> List[str]:
     """Search using the ddgs library if available.
 
@@ -513,25 +691,21 @@ def _scrape_duckduckgo_html(query: str, max_results: int = 5) -> List[str]:
         url = f"https://duckduckgo.com/html/?q={params}"
         logger.debug(f"Scraping DuckDuckGo HTML: {url}")
         
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/105.0.0.0 Safari/537.36"
-            )
-        }
-        
-        resp = requests.get(url, headers=headers, timeout=20)
+        resp = _SESSION.get(url, timeout=20)
         
         if resp.status_code != 200:
             logger.warning(f"DuckDuckGo HTML returned status {resp.status_code} for query: '{query}'")
             return []
         
-        logger.debug(f"Successfully retrieved HTML (length: {len(resp.text)} chars)")
-        soup = BeautifulSoup(resp.text, "html.parser")
+        logger.debug(f"Successfully retrieved HTML (length: {len(resp.content)} bytes)")
+        # Hand over the raw bytes with the declared charset so bs4 skips sniffing
+        soup = BeautifulSoup(
+            resp.content, _BS4_PARSER,
+            parse_only=_RESULT_LINK_STRAINER, from_encoding=resp.encoding,
+        )
         links: List[str] = []
         
-        for idx, a in enumerate(soup.select("a.result__a"), 1):
+        for idx, a in enumerate(soup.find_all("a"), 1):
             href = a.get("href")
             if href and isinstance(href, str):
                 links.append(href)
@@ -554,13 +728,59 @@ def _scrape_duckduckgo_html(query: str, max_results: int = 5) -> List[str]:
         return []
 
 
+def _search_cache_key(query: str, max_results: int) -> str:
+    return f"{max_results}|{query}"
+
+
+def get_cached_search(query: str, max_results: int) -> Optional[List[str]]:
+    """Return cached results for a query if present and not expired.
+    
+    Parameters
+    ----------
+    query : str
+        The search query.
+    max_results : int
+        The result limit the query was run with (part of the cache key).
+    
+    Returns
+    -------
+    Optional[List[str]]
+        The cached URLs, or None on a miss.
+    """
+    key = _search_cache_key(query, max_results)
+    try:
+        with _search_cache_lock, shelve.open(SEARCH_CACHE_FILE, flag="r") as cache:
+            entry = cache.get(key)
+    except dbm.error:
+        # No cache file yet (or unreadable) - treat as a miss
+        return None
+    
+    if not entry:
+        return None
+    cached_at, results = entry
+    if time.time() - cached_at > SEARCH_CACHE_TTL:
+        return None
+    return list(results)
+
+
+def store_cached_search(query: str, max_results: int, results: List[str]) -> None:
+    """Persist results for a query to the on-disk search cache."""
+    key = _search_cache_key(query, max_results)
+    try:
+        with _search_cache_lock, shelve.open(SEARCH_CACHE_FILE, flag="c") as cache:
+            cache[key] = (time.time(), list(results))
+    except dbm.error as e:
+        logger.warning(f"Could not write search cache: {e}")
+
+
 def search_links(query: str, max_results: int = 5) -> List[str]:
     """Search for a query and return a list of candidate URLs.
 
     This helper first tries the ``ddgs`` library; if that
     yields no results (or if the library is not installed), it falls
     back to scraping DuckDuckGo's HTML interface.  The returned list
-    contains at most ``max_results`` unique URLs.
+    contains at most ``max_results`` unique URLs.  Non-empty results are
+    cached on disk for ``SEARCH_CACHE_TTL`` seconds.
     """
     if not query:
         logger.error("Empty query provided to search_links")
@@ -568,22 +788,76 @@ def search_links(query: str, max_results: int = 5) -> List[str]:
     
     logger.debug(f"{Fore.YELLOW}━━━ Searching for: '{query}' ━━━{Style.RESET_ALL}")
     
-    # Try official DDG library first
-    results = _ddg_search(query, max_results=max_results)
-    if results:
-        logger.info(f"{Fore.GREEN}✓ Found {len(results)} results using ddgs{Style.RESET_ALL}")
-        return results
+    cached = get_cached_search(query, max_results)
+    if cached is not None:
+        logger.info(f"{Fore.GREEN}✓ Using {len(cached)} cached results{Style.RESET_ALL}")
+        return cached
     
-    # Fallback to HTML scraping
-    logger.info(f"{Fore.YELLOW}⚠ Falling back to HTML scraping...{Style.RESET_ALL}")
-    results = _scrape_duckduckgo_html(query, max_results=max_results)
+    try:
+        with _search_slot():
+            # Try official DDG library first
+            results = _ddg_search(query, max_results=max_results)
+            if results:
+                logger.info(f"{Fore.GREEN}✓ Found {len(results)} results using ddgs{Style.RESET_ALL}")
+            else:
+                # Fallback to HTML scraping
+                logger.info(f"{Fore.YELLOW}⚠ Falling back to HTML scraping...{Style.RESET_ALL}")
+                results = _scrape_duckduckgo_html(query, max_results=max_results)
+    except SearchStopped:
+        logger.debug(f"Search stopped before querying: '{query}'")
+        return []
     
-    if not results:
+    if results:
+        store_cached_search(query, max_results, results)
+    else:
         logger.warning(f"{Fore.YELLOW}No results found for query: '{query}'{Style.RESET_ALL}")
     
     return results
 
 
+def _substring_re(substrings) -> "re.Pattern":
+    """Compile a pattern matching any of the given literal substrings."""
+    return re.compile("|".join(map(re.escape, substrings)))
+
+
+# Used by is_relevant_url on every candidate URL (matched against the
+# lowercased "path query" string unless noted)
+_ACADEMIC_SUFFIXES = (".ac.uk", ".edu", ".edu.uk")
+
+# Course/degree/study content (common false positives)
+_URL_EXCLUDE_PATTERNS = (
+    "courses", "course", "study", "undergraduate", "postgraduate",
+    "taught", "degree", "msc", "mba", "bsc", "ba", "phd",
+    "programme", "program", "student", "prospectus",
+    "admissions", "apply", "entry", "module", "finance-course",
+    "accounting-course", "business-school", "/courses/", "/study/"
+)
+
+_URL_FINANCIAL_KEYWORDS = (
+    "financial-statement", "financial_statement",
+    "annual-report", "annual_report", "annual-review",
+    "audited-account", "audited_account",
+    "financial-account", "accounts",
+    "finance/report", "governance/finance", "about/finance"
+)
+
+_URL_FINANCIAL_PDF_TERMS = ("financial", "annual", "account", "report")
+
+# Matched against the path only
+_URL_PREFERRED_SECTIONS = (
+    "/governance/", "/about/", "/corporate/", "/finance/",
+    "/report/", "/publication/", "/document/"
+)
+
+_URL_EXCLUDE_RE = _substring_re(_URL_EXCLUDE_PATTERNS)
+_URL_FINANCIAL_KEYWORD_RE = _substring_re(_URL_FINANCIAL_KEYWORDS)
+_URL_FINANCIAL_PDF_TERM_RE = _substring_re(_URL_FINANCIAL_PDF_TERMS)
+_URL_PREFERRED_SECTION_RE = _substring_re(_URL_PREFERRED_SECTIONS)
+
+# Four-digit years (2000-2099) in a URL or filename
+_YEAR_RE = re.compile(r"20\d{2}")
+
+
 def is_relevant_url(url: str, university: University) -> bool:
     """Heuristic to decide whether a URL is likely to contain financial statements.
 
@@ -616,48 +890,26 @@ def is_relevant_url(url: str, university: University) -> bool:
         
         # If we don't have a specific domain, at least check it's academic
         if not uni_domain:
-            academic_suffixes = (".ac.uk", ".edu", ".edu.uk")
-            is_academic = any(domain.endswith(suffix) for suffix in academic_suffixes)
-            if not is_academic:
+            if not domain.endswith(_ACADEMIC_SUFFIXES):
                 logger.debug(f"URL not from academic domain: {url}")
                 return False
         
         # 2. EXCLUDE course/degree/study content (common false positives)
-        exclude_patterns = [
-            "courses", "course", "study", "undergraduate", "postgraduate",
-            "taught", "degree", "msc", "mba", "bsc", "ba", "phd",
-            "programme", "program", "student", "prospectus",
-            "admissions", "apply", "entry", "module", "finance-course",
-            "accounting-course", "business-school", "/courses/", "/study/"
-        ]
-        
-        if any(pattern in full_url_lower for pattern in exclude_patterns):
+        if _URL_EXCLUDE_RE.search(full_url_lower):
             logger.debug(f"{Fore.YELLOW}✗ Excluded (course/degree content): {url}{Style.RESET_ALL}")
             return False
         
         # 3. Check for financial statement keywords
-        financial_keywords = [
-            "financial-statement", "financial_statement",
-            "annual-report", "annual_report", "annual-review",
-            "audited-account", "audited_account",
-            "financial-account", "accounts",
-            "finance/report", "governance/finance", "about/finance"
-        ]
-        
-        has_financial_keyword = any(kw in full_url_lower for kw in financial_keywords)
+        has_financial_keyword = _URL_FINANCIAL_KEYWORD_RE.search(full_url_lower) is not None
         
         # 4. Also check for PDF files with financial terms
         is_financial_pdf = (
             path.endswith(".pdf") and 
-            any(term in full_url_lower for term in ["financial", "annual", "account", "report"])
+            _URL_FINANCIAL_PDF_TERM_RE.search(full_url_lower) is not None
         )
         
         # 5. Prefer governance/corporate/about sections
-        preferred_sections = [
-            "/governance/", "/about/", "/corporate/", "/finance/",
-            "/report/", "/publication/", "/document/"
-        ]
-        in_preferred_section = any(section in path for section in preferred_sections)
+        in_preferred_section = _URL_PREFERRED_SECTION_RE.search(path) is not None
         
         is_relevant = has_financial_keyword or is_financial_pdf
         
@@ -687,10 +939,7 @@ def extract_year_from_url(url: str) -> Optional[int]:
     Optional[int]
         The year if found, None otherwise
     """
-    import re
-    # Look for 4-digit years (2000-2099)
-    year_pattern = r'(20\d{2})'
-    matches = re.findall(year_pattern, url)
+    matches = _YEAR_RE.findall(url)
     if matches:
         # Return the most recent year found
         years = [int(y) for y in matches]
@@ -705,8 +954,8 @@ def find_financial_statements(university: University, max_links: int = 20) -> Li
     university and performs a DuckDuckGo search for each term.  It
     collects result URLs that appear relevant according to
     ``is_relevant_url`` and stops once ``max_links`` unique URLs have
-    been found.  A short delay is inserted between queries to avoid
-    overwhelming the search provider.
+    been found.  Query starts are spaced out across all workers (see
+    ``SEARCH_MIN_INTERVAL``) to avoid overwhelming the search provider.
 
     Parameters
     ----------
@@ -740,10 +989,12 @@ def find_financial_statements(university: University, max_links: int = 20) -> Li
         
         logger.debug(f"{Fore.MAGENTA}Will search using {len(search_terms)} terms{Style.RESET_ALL}")
         
-        # Use tqdm progress bar if available
-        term_iterator = tqdm(search_terms, desc=f"Searching", leave=False, disable=not _HAVE_TQDM) if _HAVE_TQDM else search_terms
-        
-        for term_idx, term in enumerate(term_iterator, 1):
+        # Universities are searched in parallel, so there is no per-term
+        # progress bar (the university bar in main tracks progress)
+        for term_idx, term in enumerate(search_terms, 1):
+            if _stop_searching.is_set():
+                logger.debug(f"Search stopped for {university.name}")
+                break
             try:
                 logger.debug(f"\n{Fore.MAGENTA}[Term {term_idx}/{len(search_terms)}] Searching: '{term}'{Style.RESET_ALL}")
                 # Request more results to find multiple years of reports
@@ -766,9 +1017,6 @@ def find_financial_statements(university: University, max_links: int = 20) -> Li
                             logger.info(f"{Fore.GREEN}Reached maximum links for {university.name}{Style.RESET_ALL}")
                             return found
                 
-                # Longer delay between searches to avoid rate limiting
-                time.sleep(2.0)
-                
             except Exception as e:
                 logger.error(f"Error processing search term '{term}': {e}", exc_info=True)
                 continue
@@ -796,6 +1044,13 @@ def find_financial_statements(university: University, max_links: int = 20) -> Li
         return []
 
 
+def _delayed_find_financial_statements(university: University, delay: float, max_links: int = 20) -> List[str]:
+    """Run ``find_financial_statements`` after ``delay`` seconds (used to stagger workers)."""
+    if delay > 0 and _stop_searching.wait(delay):
+        return []
+    return find_financial_statements(university, max_links=max_links)
+
+
 def save_results_to_csv(results: List[dict], filename: Optional[str] = None) -> str:
     """Save search results to a CSV file.
     
@@ -837,13 +1092,17 @@ def save_results_to_csv(results: List[dict], filename: Optional[str] = None) ->
         return ""
 
 
-def main(verbose: bool = False) -> None:
+def main(verbose: bool = False, workers: int = UNIVERSITY_WORKERS) -> None:
     """Iterate over universities and print candidate financial statement URLs.
     
     Parameters
     ----------
     verbose : bool
         If True, show detailed DEBUG logs including search terms and URLs.
+    workers : int
+        Number of universities searched in parallel.  Queries across all
+        workers are still capped at ``MAX_CONCURRENT_SEARCHES`` and spaced
+        ``SEARCH_MIN_INTERVAL`` seconds apart.
     """
     global logger
     
@@ -884,50 +1143,70 @@ def main(verbose: bool = False) -> None:
         successful = 0
         total_urls = 0
         
-        # Store all results for CSV export
-        all_results = []
+        # Store results per university; the CSV keeps the original list order
+        results_by_uni: dict[str, List[dict]] = {}
+        workers = max(1, workers)
+        _stop_searching.clear()
+        logger.info(f"{Fore.CYAN}Searching with {workers} parallel workers{Style.RESET_ALL}")
         
-        # Use tqdm progress bar if available
-        uni_iterator = tqdm(universities, desc="Processing universities", unit="uni") if _HAVE_TQDM else universities
-        
-        for uni in uni_iterator:
-            try:
-                # Request more links to capture multiple years of financial reports
-                urls = find_financial_statements(uni, max_links=20)
-                processed += 1
-                
-                # Print results
-                print(f"\n{Fore.CYAN}{Style.BRIGHT}{uni.name}{Style.RESET_ALL} {Fore.WHITE}({uni.country}){Style.RESET_ALL}")
-                
-                if urls:
-                    successful += 1
-                    total_urls += len(urls)
-                    for u in urls:
-                        year = extract_year_from_url(u)
-                        year_tag = f" {Fore.BLUE}[{year}]{Style.RESET_ALL}" if year else ""
-                        print(f"  {Fore.GREEN}✓{Style.RESET_ALL}{year_tag} {u}")
-                        
-                        # Store result for CSV
-                        all_results.append({
-                            'university': uni.name,
-                            'country': uni.country,
-                            'domain': uni.domain or 'N/A',
-                            'year': year if year else 'N/A',
-                            'url': u
-                        })
-                else:
-                    print(f"  {Fore.YELLOW}⚠ No obvious financial statement pages found{Style.RESET_ALL}")
-                
-            except KeyboardInterrupt:
-                logger.warning(f"\n{Fore.YELLOW}Search interrupted by user{Style.RESET_ALL}")
-                break
-            except Exception as e:
-                logger.error(f"Error processing {uni.name}: {e}", exc_info=True)
-                print(f"  {Fore.RED}\u2717 Error occurred during search{Style.RESET_ALL}")
-                continue
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            # Request more links to capture multiple years of financial reports
+            future_to_uni = {
+                executor.submit(
+                    _delayed_find_financial_statements, uni,
+                    idx * UNIVERSITY_STAGGER_SECONDS if idx < workers else 0.0, 20,
+                ): uni
+                for idx, uni in enumerate(universities)
+            }
+            
+            # Use tqdm progress bar if available
+            completed = as_completed(future_to_uni)
+            uni_iterator = tqdm(completed, total=total_unis, desc="Processing universities", unit="uni") if _HAVE_TQDM else completed
             
-            # Small delay between universities to avoid rate limiting
-            time.sleep(0.5)
+            for future in uni_iterator:
+                uni = future_to_uni[future]
+                try:
+                    urls = future.result()
+                    processed += 1
+                    
+                    # Print results
+                    print(f"\n{Fore.CYAN}{Style.BRIGHT}{uni.name}{Style.RESET_ALL} {Fore.WHITE}({uni.country}){Style.RESET_ALL}")
+                    
+                    if urls:
+                        successful += 1
+                        total_urls += len(urls)
+                        uni_results = results_by_uni.setdefault(uni.name, [])
+                        for u in urls:
+                            year = extract_year_from_url(u)
+                            year_tag = f" {Fore.BLUE}[{year}]{Style.RESET_ALL}" if year else ""
+                            print(f"  {Fore.GREEN}✓{Style.RESET_ALL}{year_tag} {u}")
+                            
+                            # Store result for CSV
+                            uni_results.append({
+                                'university': uni.name,
+                                'country': uni.country,
+                                'domain': uni.domain or 'N/A',
+                                'year': year if year else 'N/A',
+                                'url': u
+                            })
+                    else:
+                        print(f"  {Fore.YELLOW}⚠ No obvious financial statement pages found{Style.RESET_ALL}")
+                    
+                except Exception as e:
+                    logger.error(f"Error processing {uni.name}: {e}", exc_info=True)
+                    print(f"  {Fore.RED}\u2717 Error occurred during search{Style.RESET_ALL}")
+                    continue
+        except KeyboardInterrupt:
+            logger.warning(f"\n{Fore.YELLOW}Search interrupted by user{Style.RESET_ALL}")
+            # Running searches stop at their next query
+            _stop_searching.set()
+        finally:
+            # Don't wait on searches still running after an interrupt: their
+            # results are dropped and the partial results are reported below
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        all_results = [r for uni in universities for r in results_by_uni.get(uni.name, [])]
         
         # Print summary
         print(f"\n{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}")
@@ -975,11 +1254,15 @@ Examples:
   python university_financials.py              # Normal mode
   python university_financials.py -v           # Verbose mode (detailed debugging)
   python university_financials.py --verbose    # Same as -v
+  python university_financials.py -w 4         # Search 4 universities at a time
 
 Output:
   - Console: Displays all found URLs with year tags
   - CSV: Automatically saves to university_financials_results_TIMESTAMP.csv
   - Log: Saves detailed logs to university_financials_TIMESTAMP.log
+  - Cache: Search results are reused for 24h from ddg_search_cache.*
+           and detected domains are kept in university_domains.json
+           (delete those files to force fresh searches)
         '''
     )
     parser.add_argument(
@@ -987,11 +1270,17 @@ Output:
         action='store_true',
         help='Enable verbose logging (shows search terms, URLs, and detailed debug info)'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=UNIVERSITY_WORKERS,
+        help=f'Number of universities to search in parallel (default: {UNIVERSITY_WORKERS})'
+    )
     
     args = parser.parse_args()
     
     try:
-        main(verbose=args.verbose)
+        main(verbose=args.verbose, workers=args.workers)
     except Exception as e:
         print(f"{Fore.RED}Unhandled exception: {e}{Style.RESET_ALL}")
         logger.error(f"Unhandled exception: {e}", exc_info=True)
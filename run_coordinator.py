@@ -17,13 +17,22 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
+import heapq
+import io
 import json
 import logging
+import os
 import re
 import subprocess
 import sys
-from collections import defaultdict
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -45,6 +54,12 @@ except ImportError:
     class Style:
         RESET_ALL = BRIGHT = ""
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging configuration."""
@@ -334,6 +349,25 @@ def load_hesa_providers(csv_path: str = "ProviderAllHESAEnhanced.csv") -> Dict:
     return _HESA_PROVIDERS
 
 
+_THE_PREFIX_RE = re.compile(r'^the\s+')
+
+# Trailing words stripped in order by normalize_name_for_matching
+_MATCH_SUFFIX_RES = tuple(re.compile(p) for p in (
+    # "university" suffix variations
+    r'\s+university$',
+    r'\s+uni$',
+    r'\s+univ$',
+    # "college" variations
+    r'\s+college$',
+    r'\s+coll$',
+    # "of" phrases that vary
+    r'\s+of\s+london$',
+    r'\s+london$',
+    # Common trailing words
+    r'\s+bristol$',
+))
+
+
 def normalize_name_for_matching(name: str) -> str:
     """
     Normalize university name for matching.
@@ -344,27 +378,15 @@ def normalize_name_for_matching(name: str) -> str:
     name = name.lower()
     
     # Remove "the" prefix
-    name = re.sub(r'^the\s+', '', name)
+    name = _THE_PREFIX_RE.sub('', name)
     
     # Normalize hyphens and apostrophes
     name = name.replace('-', ' ')
     name = name.replace("'", '')
     
-    # Remove "university" suffix variations
-    name = re.sub(r'\s+university$', '', name)
-    name = re.sub(r'\s+uni$', '', name)
-    name = re.sub(r'\s+univ$', '', name)
-    
-    # Remove "college" variations
-    name = re.sub(r'\s+college$', '', name)
-    name = re.sub(r'\s+coll$', '', name)
-    
-    # Remove "of" phrases that vary
-    name = re.sub(r'\s+of\s+london$', '', name)
-    name = re.sub(r'\s+london$', '', name)
-    
-    # Remove common trailing words
-    name = re.sub(r'\s+bristol$', '', name)
+    # Remove suffix variations (each applied once, in order)
+    for pattern in _MATCH_SUFFIX_RES:
+        name = pattern.sub('', name)
     
     # Normalize whitespace
     name = ' '.join(name.split())
@@ -372,6 +394,7 @@ def normalize_name_for_matching(name: str) -> str:
     return name.strip()
 
 
+@lru_cache(maxsize=4096)
 def match_university_to_ukprn(extracted_name: str) -> Tuple[Optional[str], str]:
     """
     Match an extracted university name to UKPRN from HESA provider list.
@@ -442,6 +465,24 @@ def match_university_to_ukprn(extracted_name: str) -> Tuple[Optional[str], str]:
 # CSV Tracking System
 # =============================================================================
 
+# Document-type suffixes stripped from university names, longest first so the
+# alternation prefers e.g. "Annual Report" over "Report". A suffix is removed
+# after a space or hyphen anywhere, or glued onto the end of the name.
+_DOC_SUFFIXES = sorted([
+    'Infographic', 'Annual Report', 'Annual-Report', 'Financial Statements',
+    'Financial-Statements', 'Accounts', 'Report', 'Document', 'FS',
+    'Final', 'Draft', 'Consolidated', 'Statement', 'Summary'
+], key=len, reverse=True)
+_DOC_SUFFIX_ALT = '|'.join(re.escape(s) for s in _DOC_SUFFIXES)
+_RE_DOC_END = re.compile(
+    rf'(?:\s+|-)(?:{_DOC_SUFFIX_ALT})\b|(?:{_DOC_SUFFIX_ALT})$',
+    re.IGNORECASE
+)
+
+_TRAILING_YEAR_RANGE_RE = re.compile(r'\s*\d{4}[-_]?\d{0,4}\s*$')
+_TRAILING_YEAR_RE = re.compile(r'\s*\d{4}\s*$')
+
+
 def canonicalize_university_name(name: str) -> str:
     """
     Convert university name to canonical form.
@@ -455,27 +496,18 @@ def canonicalize_university_name(name: str) -> str:
     # Replace underscores with spaces
     name = name.replace('_', ' ')
     
-    # Remove common document-type suffixes
-    doc_suffixes = [
-        'Infographic', 'Annual Report', 'Annual-Report', 'Financial Statements',
-        'Financial-Statements', 'Accounts', 'Report', 'Document', 'FS',
-        'Final', 'Draft', 'Consolidated', 'Statement', 'Summary'
-    ]
-    
-    for suffix in doc_suffixes:
-        # Remove suffix if it appears at the end (case-insensitive)
-        if name.lower().endswith(suffix.lower()):
-            name = name[:-(len(suffix))].strip()
-        # Remove if appears after a space or hyphen
-        pattern = rf'\s+{re.escape(suffix)}\b'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-        pattern = rf'-{re.escape(suffix)}\b'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+    # Remove common document-type suffixes; repeat until stable so cascaded
+    # suffixes like "Name Annual Report Final" are fully stripped
+    while True:
+        new_name = _RE_DOC_END.sub('', name).rstrip()
+        if new_name == name:
+            break
+        name = new_name
     
     # Remove year patterns from the name
     # This catches cases like "University Name 2023-24"
-    name = re.sub(r'\s*\d{4}[-_]?\d{0,4}\s*$', '', name)
-    name = re.sub(r'\s*\d{4}\s*$', '', name)
+    name = _TRAILING_YEAR_RANGE_RE.sub('', name)
+    name = _TRAILING_YEAR_RE.sub('', name)
     
     # Clean up extra whitespace
     name = ' '.join(name.split())
@@ -490,6 +522,12 @@ def canonicalize_university_name(name: str) -> str:
     return name.strip()
 
 
+# Fallback patterns for year strings the fast path in normalize_year_to_ending can't handle
+_YEAR_RANGE_PREFIX_RE = re.compile(r'(\d{4})[-_](\d{2,4})')
+_SINGLE_YEAR_RE = re.compile(r'(\d{4})$')
+
+
+@lru_cache(maxsize=1024)
 def normalize_year_to_ending(year_str: str) -> str:
     """
     Normalize year to ending year format.
@@ -505,8 +543,19 @@ def normalize_year_to_ending(year_str: str) -> str:
     if not year_str:
         return ""
     
+    # Fast path for the common well-formed shapes: YYYY, YYYY-YY, YYYY-YYYY, YYYY_YY
+    n = len(year_str)
+    if n == 4 and year_str.isdecimal():
+        # Financial year starting 2023 ends in 2024
+        return str(int(year_str) + 1)
+    if n in (7, 9) and year_str[4] in '-_' and year_str[:4].isdecimal():
+        end_part = year_str[5:]
+        if end_part.isdecimal():
+            # 2023-24 -> 2024, 2023-2024 -> 2024
+            return year_str[:2] + end_part if n == 7 else end_part
+    
     # Handle range formats: 2023-24, 2023-2024, 2023_24
-    range_match = re.match(r'(\d{4})[-_](\d{2,4})', year_str)
+    range_match = _YEAR_RANGE_PREFIX_RE.match(year_str)
     if range_match:
         start_year = range_match.group(1)
         end_part = range_match.group(2)
@@ -521,7 +570,7 @@ def normalize_year_to_ending(year_str: str) -> str:
         return end_year
     
     # Single year: assume it's the starting year, add 1 for ending year
-    single_match = re.match(r'(\d{4})$', year_str)
+    single_match = _SINGLE_YEAR_RE.match(year_str)
     if single_match:
         start_year = int(single_match.group(1))
         # Financial year starting 2023 ends in 2024
@@ -555,12 +604,16 @@ def get_file_download_timestamp(file_path: Path) -> str:
         return ""
 
 
+_URL_RE = re.compile(r'https?://[^\s<>"\']+')
+
+
 def extract_source_url_from_logs(pdf_filename: str, downloads_dir: Path = None) -> str:
     """
     Extract source URL for a PDF from download logs.
     
     Searches through log files in logs/ directory for download records.
-    Looks for "Attempting direct download:" lines followed by the PDF filename.
+    Looks for a "Direct download source:" line naming the PDF, or (in older
+    logs) an "Attempting direct download:" line followed by the PDF filename.
     """
     logs_dir = Path('logs')
     if not logs_dir.exists():
@@ -583,11 +636,16 @@ def extract_source_url_from_logs(pdf_filename: str, downloads_dir: Path = None)
                     # Look for lines mentioning this PDF
                     for i, line in enumerate(lines):
                         if pdf_name in line or pdf_filename in line:
+                            # Newer logs name the source URL on the same line
+                            if 'Direct download source:' in line:
+                                url_match = _URL_RE.search(line)
+                                if url_match:
+                                    return url_match.group(0)
                             # Look backwards for the most recent "Attempting direct download:" line
                             for j in range(i-1, max(0, i-10), -1):
                                 if 'Attempting direct download:' in lines[j]:
                                     # Extract URL from this line
-                                    url_match = re.search(r'https?://[^\s<>"\']+', lines[j])
+                                    url_match = _URL_RE.search(lines[j])
                                     if url_match:
                                         url = url_match.group(0)
                                         # Filter out localhost and common non-source URLs
@@ -601,12 +659,19 @@ def extract_source_url_from_logs(pdf_filename: str, downloads_dir: Path = None)
     return ""
 
 
+# Column order of the CSV tracker; every row dict carries all of these keys
+CSV_FIELDNAMES = ['id', 'ukprn', 'university', 'year', 'source_url', 'download_timestamp', 'pdf_path', 'txt_path', 'json_path']
+
+
 def load_csv_tracker(csv_path: Path) -> List[Dict]:
     """
     Load the CSV tracking file.
     
     Returns list of dicts with keys:
     - id, university, year, source_url, pdf_path, txt_path, json_path
+    
+    Missing columns are filled with empty strings so callers can index
+    rows directly instead of using .get() with defaults.
     """
     if not csv_path.exists():
         logging.info(f"CSV tracker doesn't exist yet: {csv_path}")
@@ -614,42 +679,61 @@ def load_csv_tracker(csv_path: Path) -> List[Dict]:
     
     rows = []
     with open(csv_path, 'r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f)
+        reader = csv.DictReader(f, restval='')
         for row in reader:
+            for key in CSV_FIELDNAMES:
+                row.setdefault(key, '')
             rows.append(row)
     
     logging.info(f"Loaded {len(rows)} rows from CSV tracker")
     return rows
 
 
+# Digest of the content last written by save_csv_tracker, per path
+_CSV_SAVED_DIGESTS: Dict[Path, bytes] = {}
+
+
 def save_csv_tracker(csv_path: Path, rows: List[Dict]) -> None:
     """
     Save the CSV tracking file with relative paths.
     
     Columns: id, ukprn, university, year, source_url, download_timestamp, pdf_path, txt_path, json_path
     Paths are stored as relative to project root (e.g., 'downloads/pdfs/file.pdf')
+    
+    The file is skipped if its content is unchanged since the last save in
+    this run, and is otherwise replaced atomically so an interrupted run
+    never leaves a truncated tracker.
     """
     # Ensure directory exists
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     
-    fieldnames = ['id', 'ukprn', 'university', 'year', 'source_url', 'download_timestamp', 'pdf_path', 'txt_path', 'json_path']
+    # Build plain tuples in column order (converting absolute paths to relative)
+    # and hand them to the C csv.writer, avoiding DictWriter's per-row dict lookups
+    path_fields = {'pdf_path', 'txt_path', 'json_path'}
+    field_specs = tuple((key, key in path_fields) for key in CSV_FIELDNAMES)
+    
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(
+        tuple(
+            to_relative_path(row[key]) if is_path and row[key] else row[key]
+            for key, is_path in field_specs
+        )
+        for row in rows
+    )
+    data = buffer.getvalue().encode('utf-8')
     
-    # Convert absolute paths to relative before saving
-    rows_to_save = []
-    for row in rows:
-        row_copy = row.copy()
-        if row_copy.get('pdf_path'):
-            row_copy['pdf_path'] = to_relative_path(row_copy['pdf_path'])
-        if row_copy.get('txt_path'):
-            row_copy['txt_path'] = to_relative_path(row_copy['txt_path'])
-        if row_copy.get('json_path'):
-            row_copy['json_path'] = to_relative_path(row_copy['json_path'])
-        rows_to_save.append(row_copy)
-    
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows_to_save)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if _CSV_SAVED_DIGESTS.get(csv_path) == digest and csv_path.exists():
+        logging.debug(f"CSV tracker unchanged, not rewriting: {csv_path}")
+        return
+    
+    tmp_path = Path(f"{csv_path}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, csv_path)
+    _CSV_SAVED_DIGESTS[csv_path] = digest
     
     logging.info(f"Saved {len(rows)} rows to CSV tracker: {csv_path}")
 
@@ -672,24 +756,18 @@ def find_csv_row(rows: List[Dict], university: str, year: str, pdf_path: str = N
     """
     for row in rows:
         # Match by UKPRN if available
-        if ukprn and row.get('ukprn') == ukprn and row['year'] == year:
-            if pdf_path is None or row.get('pdf_path', '') == pdf_path:
+        if ukprn and row['ukprn'] == ukprn and row['year'] == year:
+            if pdf_path is None or row['pdf_path'] == pdf_path:
                 return row
         # Fall back to name matching
         elif not ukprn and row['university'] == university and row['year'] == year:
-            if pdf_path is None or row.get('pdf_path', '') == pdf_path:
+            if pdf_path is None or row['pdf_path'] == pdf_path:
                 return row
     return None
 
 
-def add_placeholder_rows(rows: List[Dict], university: str, years: List[str], ukprn: str = None) -> List[Dict]:
-    """
-    Add placeholder rows for missing university/year combinations.
-    
-    Only adds if the combination doesn't already exist.
-    Uses UKPRN for identification when available.
-    """
-    # Get UKPRN and official name if not provided
+def _resolve_placeholder_identity(university: str, ukprn: str = None) -> Tuple[Optional[str], str]:
+    """Get UKPRN and official name for a placeholder row."""
     if not ukprn:
         ukprn, official_name = match_university_to_ukprn(university)
         if not ukprn:
@@ -698,21 +776,39 @@ def add_placeholder_rows(rows: List[Dict], university: str, years: List[str], uk
     else:
         providers = load_hesa_providers()
         official_name = providers['ukprn_to_name'].get(ukprn, university)
+    return ukprn, official_name
+
+
+def _append_placeholder_rows(
+    rows: List[Dict],
+    official_name: str,
+    years: List[str],
+    ukprn: Optional[str],
+    existing: Set[Tuple[str, str, str]],
+    next_id: int
+) -> int:
+    """
+    Append placeholder rows for years not already in the existence index.
     
-    next_id = get_next_id(rows)
+    `existing` holds ('ukprn', ukprn, year) and ('name', university, year)
+    entries and is updated in place. Returns the next free ID.
+    """
     added_count = 0
     
     for year in years:
-        # Normalize year to ending year format
-        normalized_year = normalize_year_to_ending(year)
+        # Normalize year to ending year format (ints are financial year starts)
+        if isinstance(year, int):
+            normalized_year = str(year + 1)
+        else:
+            normalized_year = normalize_year_to_ending(year)
         
         # Check if any row exists for this UKPRN/year combo
         if ukprn:
-            existing = [r for r in rows if r.get('ukprn') == ukprn and r['year'] == normalized_year]
+            key = ('ukprn', ukprn, normalized_year)
         else:
-            existing = [r for r in rows if r['university'] == official_name and r['year'] == normalized_year]
+            key = ('name', official_name, normalized_year)
         
-        if not existing:
+        if key not in existing:
             # Add placeholder row
             rows.append({
                 'id': str(next_id),
@@ -725,97 +821,151 @@ def add_placeholder_rows(rows: List[Dict], university: str, years: List[str], uk
                 'txt_path': '',
                 'json_path': ''
             })
+            if ukprn:
+                existing.add(('ukprn', ukprn, normalized_year))
+            existing.add(('name', official_name, normalized_year))
             next_id += 1
             added_count += 1
     
     if added_count > 0:
         logging.debug(f"Added {added_count} placeholder rows for {official_name}")
     
+    return next_id
+
+
+def _placeholder_index(rows: List[Dict]) -> Set[Tuple[str, str, str]]:
+    """Build the (UKPRN, year) / (name, year) existence index over tracker rows."""
+    existing = {('name', r['university'], r['year']) for r in rows}
+    existing.update(('ukprn', r['ukprn'], r['year']) for r in rows if r['ukprn'])
+    return existing
+
+
+def add_placeholder_rows(rows: List[Dict], university: str, years: List[str], ukprn: str = None) -> List[Dict]:
+    """
+    Add placeholder rows for missing university/year combinations.
+    
+    Only adds if the combination doesn't already exist.
+    Uses UKPRN for identification when available.
+    """
+    ukprn, official_name = _resolve_placeholder_identity(university, ukprn)
+    _append_placeholder_rows(rows, official_name, years, ukprn, _placeholder_index(rows), get_next_id(rows))
+    return rows
+
+
+def add_placeholder_rows_batch(rows: List[Dict], missing_data: Dict[str, List[int]]) -> List[Dict]:
+    """
+    Add placeholder rows for every university in missing_data.
+    
+    Same behaviour as calling add_placeholder_rows once per university, but the
+    existence index and next ID are built once for the whole batch.
+    """
+    existing = _placeholder_index(rows)
+    next_id = get_next_id(rows)
+    
+    for university, years in missing_data.items():
+        ukprn, official_name = _resolve_placeholder_identity(university)
+        next_id = _append_placeholder_rows(rows, official_name, years, ukprn, existing, next_id)
+    
     return rows
 
 
-def update_csv_with_extracted_files(rows: List[Dict], extracted_dir: Path) -> List[Dict]:
+def update_csv_with_extracted_files(rows: List[Dict], extracted_dir: Path, index: Optional[Dict] = None) -> List[Dict]:
     """
     Scan extracted_text directory and update CSV with found files.
     
     Adds rows for any university/year combinations found in extracted files.
     Uses UKPRN for identification and official HESA names.
+    
+    Args:
+        rows: CSV tracker rows (updated in place)
+        extracted_dir: Directory of extracted text files
+        index: Result of scan_extracted_dir (scanned here if not given)
     """
-    txt_files = list(extracted_dir.glob("*.txt"))
-    json_files = list(extracted_dir.glob("*.json"))
+    if index is None:
+        index = scan_extracted_dir(extracted_dir)
+    json_names = index['json']
+    
+    logging.info(f"Updating CSV with {len(index['txt'])} txt files and {len(json_names)} json files")
     
-    logging.info(f"Updating CSV with {len(txt_files)} txt files and {len(json_files)} json files")
+    # Compute the next free ID once; new rows increment it locally
+    next_id = get_next_id(rows)
+    
+    # List the download directories once rather than once per file
+    downloads_dirs = list(Path('.').glob('downloads_*'))
+    
+    # Index rows by txt_path so each file is matched without scanning every row
+    rows_by_txt_path = defaultdict(list)
+    for row in rows:
+        rows_by_txt_path[row['txt_path']].append(row)
     
     # Process txt files
-    for txt_file in txt_files:
-        uni_name_raw = extract_university_name(txt_file.name)
-        year_raw = extract_year_from_filename(txt_file.name)
-        
-        if not uni_name_raw or not year_raw:
+    for txt_name, result in index['txt'].items():
+        if result is None:
             continue
+        txt_file = extracted_dir / txt_name
+        _, ukprn, official_name, year, _ = result
         
-        # Match to UKPRN and get official name
-        ukprn, official_name = match_university_to_ukprn(uni_name_raw)
-        year = normalize_year_to_ending(year_raw)
-        
-        # Check for invalid years
-        try:
-            year_int = int(year)
-            if year_int < 1990 or year_int > 2100:
-                continue
-        except (ValueError, IndexError):
+        # Only plain ending years are tracked in the CSV
+        if not year.isdecimal():
             continue
         
         # Find corresponding json file
-        json_file = extracted_dir / txt_file.name.replace('.txt', '.json')
-        json_path = str(json_file.absolute()) if json_file.exists() else ''
-        
-        # Try to find matching PDF (look in all downloads_* directories)
-        pdf_path = ''
-        pdf_file_obj = None
-        pdf_search_name = txt_file.stem  # Filename without .txt
-        for downloads_dir in Path('.').glob('downloads_*'):
-            possible_pdf = downloads_dir / f"{pdf_search_name}.pdf"
-            if possible_pdf.exists():
-                pdf_path = str(possible_pdf.absolute())
-                pdf_file_obj = possible_pdf
-                break
-        
-        # Extract metadata
-        source_url = extract_source_url_from_logs(f"{pdf_search_name}.pdf") if pdf_file_obj else ''
-        download_timestamp = get_file_download_timestamp(pdf_file_obj) if pdf_file_obj else ''
+        json_name = txt_name.replace('.txt', '.json')
+        json_path = str((extracted_dir / json_name).absolute()) if json_name in json_names else ''
         
         # Check if row already exists for this file (match by UKPRN if available)
+        txt_path = str(txt_file.absolute())
         existing_row = None
-        for row in rows:
+        for row in rows_by_txt_path.get(txt_path, ()):
             # Match by UKPRN if available
-            if ukprn and row.get('ukprn') == ukprn and row['year'] == year:
-                if row.get('txt_path', '') == str(txt_file.absolute()):
-                    existing_row = row
-                    break
+            if ukprn and row['ukprn'] == ukprn and row['year'] == year:
+                existing_row = row
+                break
             # Fall back to name matching
             elif not ukprn and row['university'] == official_name and row['year'] == year:
-                if row.get('txt_path', '') == str(txt_file.absolute()):
-                    existing_row = row
+                existing_row = row
+                break
+        
+        # PDF metadata only fills empty fields, so skip the downloads and log
+        # lookups for rows that already have all of it (e.g. on a second pass)
+        pdf_path = ''
+        source_url = ''
+        download_timestamp = ''
+        if existing_row is None or not (
+            existing_row['pdf_path'] and existing_row['source_url'] and existing_row['download_timestamp']
+        ):
+            # Try to find matching PDF (look in all downloads_* directories)
+            pdf_file_obj = None
+            pdf_search_name = txt_file.stem  # Filename without .txt
+            for downloads_dir in downloads_dirs:
+                possible_pdf = downloads_dir / f"{pdf_search_name}.pdf"
+                if possible_pdf.exists():
+                    pdf_path = str(possible_pdf.absolute())
+                    pdf_file_obj = possible_pdf
                     break
+            
+            # Extract metadata
+            if pdf_file_obj:
+                if existing_row is None or not existing_row['source_url']:
+                    source_url = extract_source_url_from_logs(f"{pdf_search_name}.pdf")
+                download_timestamp = get_file_download_timestamp(pdf_file_obj)
         
         if existing_row:
             # Update existing row with metadata and UKPRN
-            if ukprn and not existing_row.get('ukprn'):
+            if ukprn and not existing_row['ukprn']:
                 existing_row['ukprn'] = ukprn
             if official_name:
                 existing_row['university'] = official_name
-            existing_row['txt_path'] = str(txt_file.absolute())
+            existing_row['txt_path'] = txt_path
             existing_row['json_path'] = json_path
-            if pdf_path and not existing_row.get('pdf_path'):
+            if pdf_path and not existing_row['pdf_path']:
                 existing_row['pdf_path'] = pdf_path
-            if source_url and not existing_row.get('source_url'):
+            if source_url and not existing_row['source_url']:
                 existing_row['source_url'] = source_url
-            if download_timestamp and not existing_row.get('download_timestamp'):
+            if download_timestamp and not existing_row['download_timestamp']:
                 existing_row['download_timestamp'] = download_timestamp
         else:
             # Create new row
-            next_id = get_next_id(rows)
             rows.append({
                 'id': str(next_id),
                 'ukprn': ukprn or '',
@@ -824,13 +974,27 @@ def update_csv_with_extracted_files(rows: List[Dict], extracted_dir: Path) -> Li
                 'source_url': source_url,
                 'download_timestamp': download_timestamp,
                 'pdf_path': pdf_path,
-                'txt_path': str(txt_file.absolute()),
+                'txt_path': txt_path,
                 'json_path': json_path
             })
+            next_id += 1
     
     return rows
 
 
+def count_pdf_files(directory: Path) -> int:
+    """
+    Count the PDF files directly inside a directory.
+    
+    Reads names straight from os.scandir instead of building a Path for
+    every entry as Path.glob("*.pdf") does.
+    """
+    if not directory.is_dir():
+        return 0
+    with os.scandir(directory) as it:
+        return sum(1 for entry in it if entry.name.endswith('.pdf') and entry.is_file())
+
+
 def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dict]:
     """
     Scan downloads directory and update CSV with downloaded PDFs.
@@ -843,6 +1007,9 @@ def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dic
     
     logging.info(f"Updating CSV with {len(pdf_files)} downloaded PDF files")
     
+    # Compute the next free ID once; new rows increment it locally
+    next_id = get_next_id(rows)
+    
     for pdf_file in pdf_files:
         uni_name_raw = extract_university_name(pdf_file.name)
         year_raw = extract_year_from_filename(pdf_file.name)
@@ -877,24 +1044,25 @@ def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dic
         json_path = str(json_file.absolute()) if json_file.exists() else ''
         
         # Find or create row (match by UKPRN if available)
+        pdf_path = str(pdf_file.absolute())
         existing_row = None
         for row in rows:
             # Match by UKPRN if available
-            if ukprn and row.get('ukprn') == ukprn and row['year'] == year and not row.get('pdf_path'):
+            if ukprn and row['ukprn'] == ukprn and row['year'] == year and not row['pdf_path']:
                 existing_row = row
                 break
             # Fall back to name matching
-            elif not ukprn and row['university'] == official_name and row['year'] == year and not row.get('pdf_path'):
+            elif not ukprn and row['university'] == official_name and row['year'] == year and not row['pdf_path']:
                 existing_row = row
                 break
         
         if existing_row:
             # Update placeholder row with all metadata and UKPRN
-            if ukprn and not existing_row.get('ukprn'):
+            if ukprn and not existing_row['ukprn']:
                 existing_row['ukprn'] = ukprn
             if official_name:
                 existing_row['university'] = official_name
-            existing_row['pdf_path'] = str(pdf_file.absolute())
+            existing_row['pdf_path'] = pdf_path
             existing_row['txt_path'] = txt_path
             existing_row['json_path'] = json_path
             existing_row['source_url'] = source_url
@@ -902,15 +1070,14 @@ def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dic
         else:
             # Check if row exists with this exact PDF (match by UKPRN if available)
             pdf_exists = any(
-                (row.get('ukprn') == ukprn if ukprn else row['university'] == official_name) and 
+                (row['ukprn'] == ukprn if ukprn else row['university'] == official_name) and 
                 row['year'] == year and 
-                row.get('pdf_path') == str(pdf_file.absolute())
+                row['pdf_path'] == pdf_path
                 for row in rows
             )
             
             if not pdf_exists:
                 # Create new row with all metadata
-                next_id = get_next_id(rows)
                 rows.append({
                     'id': str(next_id),
                     'ukprn': ukprn or '',
@@ -918,10 +1085,11 @@ def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dic
                     'year': year,
                     'source_url': source_url,
                     'download_timestamp': download_timestamp,
-                    'pdf_path': str(pdf_file.absolute()),
+                    'pdf_path': pdf_path,
                     'txt_path': txt_path,
                     'json_path': json_path
                 })
+                next_id += 1
     
     return rows
 
@@ -931,13 +1099,39 @@ def update_csv_with_downloads(rows: List[Dict], downloads_dir: Path) -> List[Dic
 # =============================================================================
 
 
+# Only emit ANSI codes for an interactive terminal; when output is piped or
+# redirected colorama would strip them again on every write
+_COLOR_OUTPUT = COLORAMA_AVAILABLE and sys.stdout.isatty()
+
+
 def colored_text(text: str, color: str) -> str:
-    """Return colored text if colorama is available."""
-    if COLORAMA_AVAILABLE:
+    """Return colored text if colorama is available and stdout is a terminal."""
+    if _COLOR_OUTPUT:
         return f"{color}{text}{Style.RESET_ALL}"
     return text
 
 
+# Section separator used around every banner heading
+BANNER = colored_text("=" * 80, Fore.CYAN)
+
+
+# Year patterns tried in order by extract_year_from_filename. These are kept as
+# separate searches rather than one fused alternation: the range pattern matches
+# most filenames and starts with \d, which lets re skip ahead to digits, whereas
+# a combined case-insensitive alternation is tried at every position and
+# benchmarked slower on the tracker's filenames.
+_YEAR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # 2023-24, 2023-2024 format (standard range)
+    r'(\d{4})[-_](\d{2,4})',
+    # accounts1920, fs1920 format (compact range like 19-20 meaning 2019-2020)
+    r'(?:accounts|fs|statements)(\d{2})(\d{2})',
+    # Single year: 2023, FS2023, accounts-2023
+    # Use word boundary to avoid matching "accounts1920" as year 1920
+    r'(?:^|[^a-zA-Z0-9])(\d{4})(?:[^0-9]|$)',
+)]
+
+
+@lru_cache(maxsize=4096)
 def extract_year_from_filename(filename: str) -> Optional[str]:
     """
     Extract financial year from filename.
@@ -953,18 +1147,8 @@ def extract_year_from_filename(filename: str) -> Optional[str]:
     Only returns years >= 1990 to avoid false matches
     """
     # Try various year patterns
-    patterns = [
-        # 2023-24, 2023-2024 format (standard range)
-        r'(\d{4})[-_](\d{2,4})',
-        # accounts1920, fs1920 format (compact range like 19-20 meaning 2019-2020)
-        r'(?:accounts|fs|statements)(\d{2})(\d{2})',
-        # Single year: 2023, FS2023, accounts-2023
-        # Use word boundary to avoid matching "accounts1920" as year 1920
-        r'(?:^|[^a-zA-Z0-9])(\d{4})(?:[^0-9]|$)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(filename)
         if match:
             year1 = match.group(1)
             
@@ -999,6 +1183,14 @@ def extract_year_from_filename(filename: str) -> Optional[str]:
     return None
 
 
+# Document keywords that indicate we've left the university name (substring match)
+_DOC_KW_RE = re.compile(
+    r'annual|report|financial|statements|accounts|fs|cu|document|final|aru',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
 def extract_university_name(filename: str) -> Optional[str]:
     """
     Extract university name from filename.
@@ -1015,22 +1207,17 @@ def extract_university_name(filename: str) -> Optional[str]:
     # Common pattern: Split on underscore and take parts that look like uni name
     parts = name.split('_')
     
-    # Document keywords that indicate we've left the university name
-    doc_keywords = ['annual', 'report', 'financial', 'statements', 'accounts', 
-                    'fs', 'accounts', 'cu', 'document', 'final', 'aru']
-    
     if len(parts) >= 1:
         # First part is typically the university name
         # Handle cases like "Anglia_Ruskin_University" or "University_of_Edinburgh"
         uni_parts = []
         for part in parts:
-            # Stop when we hit a year pattern
-            if re.match(r'^\d{4}', part):  # Starts with year
+            # Stop when we hit a year pattern (starts with 4 digits)
+            if len(part) >= 4 and part[0].isdecimal() and part[:4].isdecimal():
                 break
             
             # Stop when we hit a document keyword (check hyphenated parts too)
-            part_lower = part.lower()
-            if any(keyword in part_lower for keyword in doc_keywords):
+            if _DOC_KW_RE.search(part):
                 break
             
             # Stop if part is very long or has many hyphens (likely a document title)
@@ -1050,38 +1237,145 @@ def extract_university_name(filename: str) -> Optional[str]:
     return None
 
 
+_UNI_STOPWORDS_RE = re.compile(r'\b(?:university|of|the|college)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def normalize_university_name(name: str) -> str:
     """
     Normalize university name for consistent matching.
     
     Removes 'University', 'of', etc. and creates canonical form.
     """
-    # Convert to lowercase
-    name = name.lower()
+    # Remove common words and collapse whitespace, lowercasing once at the end
+    return ' '.join(_UNI_STOPWORDS_RE.sub(' ', name).split()).lower()
+
+
+# Minimum number of files before analyze_extracted_text uses a process pool
+PARALLEL_ANALYZE_THRESHOLD = 2000
+
+
+def _parse_extracted_filename(filename: str) -> Optional[Tuple[str, Optional[str], str, str, int]]:
+    """
+    Parse one extracted text filename for analyze_extracted_text.
     
-    # Remove common words
-    for word in ['university', 'of', 'the', 'college']:
-        name = name.replace(word, '')
+    Top-level so it can be sent to worker processes.
     
-    # Remove extra whitespace
-    name = ' '.join(name.split())
+    Returns:
+        (key, ukprn, official_name, year, year_int) or None if the filename
+        has no usable university name or year
+    """
+    # Extract university name and match to UKPRN
+    uni_name_raw = extract_university_name(filename)
+    if not uni_name_raw:
+        return None
     
-    return name.strip()
+    ukprn, official_name = match_university_to_ukprn(uni_name_raw)
+    
+    # Extract year and normalize
+    year = extract_year_from_filename(filename)
+    if not year:
+        return None
+    year = normalize_year_to_ending(year)
+    
+    # Filter out invalid years (should be 1990-2100)
+    try:
+        year_int = int(year.split('-')[0]) if '-' in year else int(year)
+        if not (1990 <= year_int <= 2100):
+            return None
+    except (ValueError, IndexError):
+        return None
+    
+    # Use UKPRN as key if available, otherwise use name
+    key = ukprn if ukprn else official_name
+    return key, ukprn, official_name, year, year_int
+
+
+def _parse_extracted_filenames(filenames: List[str]) -> List[Optional[Tuple[str, Optional[str], str, str, int]]]:
+    """
+    Run _parse_extracted_filename over many filenames, in order.
+    
+    Parsing is CPU-bound and independent per file, so large directories
+    are fanned out across a process pool.
+    """
+    if len(filenames) >= PARALLEL_ANALYZE_THRESHOLD:
+        # Workers need the HESA lookup: forked workers inherit the parent's
+        # warm cache, while spawned ones (the default on macOS) load it once
+        # each in the initializer rather than per filename
+        load_hesa_providers()
+        with ProcessPoolExecutor(initializer=load_hesa_providers) as executor:
+            return list(executor.map(_parse_extracted_filename, filenames, chunksize=256))
+    return [_parse_extracted_filename(name) for name in filenames]
 
 
-def analyze_extracted_text(extracted_dir: Path) -> Dict[str, Dict[str, any]]:
+# Parsed listings of extracted text directories: path -> (dir st_mtime_ns, index)
+_EXTRACTED_INDEX_CACHE: Dict[Path, Tuple[int, Dict]] = {}
+
+
+def scan_extracted_dir(extracted_dir: Path) -> Dict:
+    """
+    List and parse an extracted text directory, reusing earlier scans.
+    
+    A run scans the same directory several times (CSV updates and
+    analysis). The listing is cached against the directory's mtime, which
+    changes whenever files are added, removed or renamed, and filenames
+    already seen are not parsed again.
+    
+    Returns:
+        Dict with:
+            - 'txt': Dict mapping .txt filename (in directory order) to its
+              _parse_extracted_filename result
+            - 'json': Set of .json filenames
+    """
+    try:
+        mtime_ns = extracted_dir.stat().st_mtime_ns
+    except OSError:
+        return {'txt': {}, 'json': set()}
+    
+    cached = _EXTRACTED_INDEX_CACHE.get(extracted_dir)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
+    txt_names = []
+    json_names = set()
+    with os.scandir(extracted_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.txt'):
+                if entry.is_file(follow_symlinks=False):
+                    txt_names.append(entry.name)
+            elif entry.name.endswith('.json'):
+                json_names.add(entry.name)
+    
+    # Only parse filenames that were not in the previous listing
+    known = cached[1]['txt'] if cached else {}
+    new_names = [name for name in txt_names if name not in known]
+    parsed_new = dict(zip(new_names, _parse_extracted_filenames(new_names)))
+    txt = {name: known[name] if name in known else parsed_new[name] for name in txt_names}
+    
+    index = {'txt': txt, 'json': json_names}
+    _EXTRACTED_INDEX_CACHE[extracted_dir] = (mtime_ns, index)
+    return index
+
+
+def analyze_extracted_text(extracted_dir: Path, index: Optional[Dict] = None) -> Dict[str, Dict[str, any]]:
     """
     Analyze extracted text directory to find available years per university.
     
     Uses UKPRN for identification and official HESA names for consistency.
     
+    Args:
+        extracted_dir: Directory of extracted text files
+        index: Result of scan_extracted_dir (scanned here if not given)
+    
     Returns:
         Dict mapping UKPRN (or university name if no UKPRN) to:
             - 'ukprn': UKPRN identifier (if matched)
             - 'name': Official university name
             - 'years': Set of available years
+            - 'years_int': Set of available years as ints
             - 'min_year': Earliest year found
             - 'max_year': Latest year found
+            - 'max_year_int': Latest year found as an int
             - 'files': List of filenames
     """
     if not extracted_dir.exists():
@@ -1094,47 +1388,30 @@ def analyze_extracted_text(extracted_dir: Path) -> Dict[str, Dict[str, any]]:
         'ukprn': '',
         'name': '',
         'years': set(),
+        'years_int': set(),
         'files': [],
         'min_year': None,
-        'max_year': None
+        'max_year': None,
+        'max_year_int': None
     })
     
-    # Process all txt files
-    txt_files = list(extracted_dir.glob("*.txt"))
-    logging.info(f"Found {len(txt_files)} text files to analyze")
+    if index is None:
+        index = scan_extracted_dir(extracted_dir)
+    parsed = index['txt']
+    logging.info(f"Found {len(parsed)} text files to analyze")
     
-    for txt_file in txt_files:
-        filename = txt_file.name
-        
-        # Extract university name and match to UKPRN
-        uni_name_raw = extract_university_name(filename)
-        if not uni_name_raw:
+    for filename, result in parsed.items():
+        if result is None:
             continue
-        
-        ukprn, official_name = match_university_to_ukprn(uni_name_raw)
-        
-        # Extract year and normalize
-        year = extract_year_from_filename(filename)
-        if not year:
-            continue
-        year = normalize_year_to_ending(year)
-        
-        # Filter out invalid years (should be 1990-2100)
-        try:
-            year_int = int(year.split('-')[0]) if '-' in year else int(year)
-            if not (1990 <= year_int <= 2100):
-                continue
-        except (ValueError, IndexError):
-            continue
-        
-        # Use UKPRN as key if available, otherwise use name
-        key = ukprn if ukprn else official_name
+        key, ukprn, official_name, year, year_int = result
         
         # Store data
-        university_data[key]['ukprn'] = ukprn or ''
-        university_data[key]['name'] = official_name
-        university_data[key]['years'].add(year)
-        university_data[key]['files'].append(filename)
+        data = university_data[key]
+        data['ukprn'] = ukprn or ''
+        data['name'] = official_name
+        data['years'].add(year)
+        data['years_int'].add(year_int)
+        data['files'].append(filename)
     
     # Calculate min/max years for each university
     for key, data in university_data.items():
@@ -1142,16 +1419,42 @@ def analyze_extracted_text(extracted_dir: Path) -> Dict[str, Dict[str, any]]:
         if years:
             data['min_year'] = years[0]
             data['max_year'] = years[-1]
+            data['max_year_int'] = max(data['years_int'])
     
     return dict(university_data)
 
 
+def _parse_start_years(years: Set[str]) -> Set[int]:
+    """Parse year strings to start-year ints, dropping invalid ones (should be 1900-2100)."""
+    years_parsed = set()
+    for year_str in years:
+        try:
+            if '-' in year_str:
+                # Range like 2023-24
+                start = int(year_str.split('-')[0])
+            else:
+                start = int(year_str)
+            
+            # Filter out garbage years (assume valid financial years are 1900-2100)
+            if 1900 <= start <= 2100:
+                years_parsed.add(start)
+        except (ValueError, IndexError):
+            # Skip unparseable years
+            continue
+    return years_parsed
+
+
+def format_financial_year(year: int) -> str:
+    """Format a financial year start as a range string (2023 -> "2023-24")."""
+    return f"{year}-{str(year+1)[-2:]}"
+
+
 def identify_missing_years(
     university_data: Dict[str, Dict],
     current_year: int = None,
     max_lookback: int = 5,
     max_forward: int = 2
-) -> Dict[str, List[str]]:
+) -> Dict[str, List[int]]:
     """
     Identify missing years for each university.
     
@@ -1167,7 +1470,8 @@ def identify_missing_years(
         max_forward: How many years forward from current to consider (default: 2)
         
     Returns:
-        Dict mapping university name to list of missing year strings
+        Dict mapping university name to sorted list of missing financial year
+        start years as ints (use format_financial_year for display)
     """
     if current_year is None:
         current_year = datetime.now().year
@@ -1178,22 +1482,10 @@ def identify_missing_years(
         if not data['years']:
             continue
         
-        # Parse years and filter out invalid ones (should be 1900-2100)
-        years_parsed = set()
-        for year_str in data['years']:
-            try:
-                if '-' in year_str:
-                    # Range like 2023-24
-                    start = int(year_str.split('-')[0])
-                else:
-                    start = int(year_str)
-                
-                # Filter out garbage years (assume valid financial years are 1900-2100)
-                if 1900 <= start <= 2100:
-                    years_parsed.add(start)
-            except (ValueError, IndexError):
-                # Skip unparseable years
-                continue
+        # Use the ints parsed during analysis when available
+        years_parsed = data.get('years_int')
+        if years_parsed is None:
+            years_parsed = _parse_start_years(data['years'])
         
         if not years_parsed:
             continue
@@ -1201,33 +1493,28 @@ def identify_missing_years(
         min_year = min(years_parsed)
         max_year = max(years_parsed)
         
-        missing_years = []
-        
-        # 1. Fill gaps between min and max (continuity)
-        for year in range(min_year, max_year + 1):
-            if year not in years_parsed:
-                year_range = f"{year}-{str(year+1)[-2:]}"
-                missing_years.append(year_range)
-        
-        # 2. Look forward from max to current year (recent missing)
-        for year in range(max_year + 1, current_year + max_forward):
-            year_range = f"{year}-{str(year+1)[-2:]}"
-            missing_years.append(year_range)
-        
-        # 3. Look back from min (limited historical depth)
-        # Only look back max_lookback years from the earliest found
+        # Target years are the union of:
+        # 1. Gaps between min and max (continuity)
+        # 2. Forward from max to current year (recent missing)
+        # 3. Back from min, limited to max_lookback years (historical depth)
         lookback_target = max(min_year - max_lookback, 2000)
-        for year in range(lookback_target, min_year):
-            year_range = f"{year}-{str(year+1)[-2:]}"
-            missing_years.append(year_range)
+        target_years = set(range(lookback_target, min_year))
+        target_years.update(range(min_year, max(max_year + 1, current_year + max_forward)))
+        
+        missing_years = sorted(target_years - years_parsed)
         
         if missing_years:
-            # Sort chronologically
-            missing_data[uni_name] = sorted(missing_years)
+            missing_data[uni_name] = missing_years
     
     return missing_data
 
 
+# Specific terms that appear in official annual reports
+# "annual report and accounts" OR "financial statements" are official terminology
+# Exclude research/thesis content by avoiding generic "annual report" alone
+_OFFICIAL_REPORT_TERMS = '("annual report and accounts" OR "annual report and financial statements" OR "report and financial statements")'
+
+
 def generate_search_query(uni_name: str, year: str, ukprn: str = None, domains: List[str] = None) -> str:
     """
     Generate search query for finding a specific year's financial report.
@@ -1244,40 +1531,100 @@ def generate_search_query(uni_name: str, year: str, ukprn: str = None, domains:
     # Clean university name
     clean_name = uni_name.replace('_', ' ')
     
-    # Use specific terms that appear in official annual reports
-    # "annual report and accounts" OR "financial statements" are official terminology
-    # Exclude research/thesis content by avoiding generic "annual report" alone
-    official_terms = '("annual report and accounts" OR "annual report and financial statements" OR "report and financial statements")'
-    
     # If we have domains, use site: operator for the primary domain
-    if domains and len(domains) > 0:
-        # Use the shortest domain (usually without www.)
-        primary_domain = min(domains, key=len)
-        query = f'site:{primary_domain} "{clean_name}" {year} {official_terms}'
+    # (the shortest domain, usually without www.); otherwise search generically
+    site_prefix = f'site:{min(domains, key=len)} ' if domains else ''
+    
+    return f'{site_prefix}"{clean_name}" {year} {_OFFICIAL_REPORT_TERMS}'
+
+
+# Serializes console reports from concurrently running download batches
+_REPORT_LOCK = threading.Lock()
+
+
+def _report_download_output(output_log: Path) -> None:
+    """Summarize search results and downloads from a step1 output log."""
+    found_pdfs = 0
+    downloads = 0
+    details = []
+    prev_lines = ['', '']
+    
+    with open(output_log, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            # Look for search results and downloads in output
+            if 'Found PDF #' in line:
+                found_pdfs += 1
+            if 'Successfully downloaded' in line:
+                downloads += 1
+            
+            # Keep the title, filename, and URL for each result
+            if 'Title:' in line:
+                details.append((line.strip(), Fore.CYAN))
+            elif 'Filename:' in line:
+                details.append((line.strip(), Fore.YELLOW))
+            elif 'URL:' in line and 'Title:' in prev_lines[0]:
+                # Only show URLs that are part of search results
+                url = line.strip()
+                if len(url) > 100:
+                    url = url[:97] + '...'
+                details.append((url, Fore.BLUE))
+                details.append(None)  # Blank line between results
+            prev_lines = [prev_lines[1], line]
+    
+    if found_pdfs > 0:
+        print(colored_text(f"  ✓ Found {found_pdfs} PDF(s) in search results", Fore.GREEN))
+        
+        # Show details of each PDF found
+        for detail in details:
+            if detail is None:
+                print()
+            else:
+                print(colored_text(f"    {detail[0]}", detail[1]))
     else:
-        # Fallback to generic search
-        query = f'"{clean_name}" {year} {official_terms}'
+        print(colored_text(f"  ✗ No PDFs found in search results", Fore.YELLOW))
     
-    return query
+    if downloads > 0:
+        print(colored_text(f"  ✓ Downloaded {downloads} file(s)", Fore.GREEN))
 
 
-def run_download_script(
-    search_query: str,
+def run_download_script_batch(
+    queries: List[Tuple[str, str, str]],
     output_dir: Path,
     limit: int = 10,
     method: str = 'requests'
 ) -> bool:
     """
-    Run the download script with a specific search query.
+    Run the download script once for a batch of search queries.
+    
+    The queries are written to a temporary JSONL file and passed to a single
+    step1 process, so interpreter startup and HTTP session setup happen once
+    per batch rather than once per query.
+    
+    Args:
+        queries: List of (university, year, search_query) tuples
+        output_dir: Directory to download into
+        limit: Maximum search results per query
+        method: Download method passed through to step1
     
     Returns:
         True if download was successful, False otherwise
     """
+    if not queries:
+        return False
+    
+    queries_file = None
     try:
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', suffix='.jsonl', prefix='queries_', delete=False
+        ) as f:
+            for uni_name, year, search_query in queries:
+                f.write(json.dumps({'university': uni_name, 'year': year, 'query': search_query}) + '\n')
+            queries_file = f.name
+        
         cmd = [
             sys.executable,
             'step1_download_pdfs.py',
-            '--search', search_query,
+            '--queries-file', queries_file,
             '--output', str(output_dir),
             '--limit', str(limit),
             '--method', method,
@@ -1285,45 +1632,30 @@ def run_download_script(
             '--verbose'  # Enable verbose output to see search results
         ]
         
-        print(colored_text(f"  🔍 Search query: {search_query}", Fore.CYAN))
-        logging.info(f"Running: {' '.join(cmd)}")
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        logging.info(f"Running: {' '.join(cmd)} ({len(queries)} queries)")
+        
+        # Stream stdout to a log file instead of buffering it all in memory
+        Path('logs').mkdir(exist_ok=True)
+        # Unique name: several batches may run concurrently
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir='logs', suffix='.log', delete=False,
+            prefix=f"step1_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
+        ) as log_f:
+            output_log = Path(log_f.name)
+            # No preexec_fn/start_new_session here: without them CPython can
+            # start the child with vfork rather than copying this process
+            result = subprocess.run(
+                cmd,
+                stdout=log_f,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=300 * len(queries)  # 5 minutes per query
+            )
+        logging.info(f"Download script output saved to: {output_log}")
         
-        # Parse and display search results with details
-        if result.stdout:
-            # Look for search results and downloads in output
-            found_pdfs = result.stdout.count('Found PDF #')
-            downloads = result.stdout.count('Successfully downloaded')
-            
-            if found_pdfs > 0:
-                print(colored_text(f"  ✓ Found {found_pdfs} PDF(s) in search results", Fore.GREEN))
-                
-                # Show details of each PDF found
-                lines = result.stdout.split('\n')
-                for i, line in enumerate(lines):
-                    # Show the title, filename, and URL for each result
-                    if 'Title:' in line:
-                        print(colored_text(f"    {line.strip()}", Fore.CYAN))
-                    elif 'Filename:' in line:
-                        print(colored_text(f"    {line.strip()}", Fore.YELLOW))
-                    elif 'URL:' in line and i > 0 and 'Title:' in lines[i-2]:
-                        # Only show URLs that are part of search results
-                        url = line.strip()
-                        if len(url) > 100:
-                            url = url[:97] + '...'
-                        print(colored_text(f"    {url}", Fore.BLUE))
-                        print()  # Blank line between results
-            else:
-                print(colored_text(f"  ✗ No PDFs found in search results", Fore.YELLOW))
-            
-            if downloads > 0:
-                print(colored_text(f"  ✓ Downloaded {downloads} file(s)", Fore.GREEN))
+        # Keep each batch's report together when batches run concurrently
+        with _REPORT_LOCK:
+            _report_download_output(output_log)
         
         if result.returncode == 0:
             logging.info("Download script completed successfully")
@@ -1335,13 +1667,16 @@ def run_download_script(
             return False
             
     except subprocess.TimeoutExpired:
-        print(colored_text(f"  ✗ Search timed out after 5 minutes", Fore.RED))
+        print(colored_text(f"  ✗ Search batch timed out after {5 * len(queries)} minutes", Fore.RED))
         logging.error("Download script timed out")
         return False
     except Exception as e:
         print(colored_text(f"  ✗ Error: {str(e)[:200]}", Fore.RED))
         logging.error(f"Error running download script: {e}")
         return False
+    finally:
+        if queries_file:
+            Path(queries_file).unlink(missing_ok=True)
 
 
 def run_extraction_script(
@@ -1419,6 +1754,13 @@ def run_extraction_script(
         return False
 
 
+def _json_default(obj):
+    """Serialize sets as sorted lists."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_progress(
     output_file: Path,
     university_data: Dict,
@@ -1433,56 +1775,61 @@ def save_progress(
         'missing_data': {}
     }
     
-    # Convert sets to lists for JSON serialization
+    # Year sets are serialized as sorted lists by _json_default
     for uni_name, data in university_data.items():
         progress['universities'][uni_name] = {
-            'years': sorted(list(data['years'])),
+            'years': data['years'],
             'min_year': data['min_year'],
             'max_year': data['max_year'],
             'file_count': len(data['files'])
         }
     
     progress['missing_data'] = {
-        uni: sorted(years) for uni, years in missing_data.items()
+        uni: [format_financial_year(year) for year in sorted(years)] for uni, years in missing_data.items()
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(progress, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        output_file.write_bytes(orjson.dumps(progress, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        output_file.write_text(
+            json.dumps(progress, indent=2, ensure_ascii=False, default=_json_default),
+            encoding='utf-8'
+        )
     
     logging.info(f"Progress saved to: {output_file}")
 
 
-def print_summary(university_data: Dict, missing_data: Dict):
-    """Print summary of current data coverage."""
-    print(colored_text("\n" + "="*80, Fore.CYAN))
-    print(colored_text("Financial Data Coverage Summary", Fore.CYAN))
-    print(colored_text("="*80, Fore.CYAN))
+def render_summary(university_data: Dict, missing_data: Dict) -> str:
+    """Render the summary of current data coverage as a single string."""
+    lines = []
+    lines.append("\n" + BANNER)
+    lines.append(colored_text("Financial Data Coverage Summary", Fore.CYAN))
+    lines.append(BANNER)
     
-    print(f"\nTotal universities with data: {len(university_data)}")
+    lines.append(f"\nTotal universities with data: {len(university_data)}")
     
     # Universities with complete recent coverage
     complete_recent = []
     incomplete = []
     
-    current_year = datetime.now().year
-    for uni_name, data in sorted(university_data.items()):
-        if data['max_year']:
-            max_year_int = int(data['max_year'].split('-')[0])
-            if max_year_int >= current_year - 2:
+    recent_cutoff = datetime.now().year - 2
+    for uni_name, data in university_data.items():
+        if data['max_year_int'] is not None:
+            if data['max_year_int'] >= recent_cutoff:
                 complete_recent.append(uni_name)
             else:
                 incomplete.append(uni_name)
     
-    print(colored_text(f"\nUniversities with recent data (last 2 years): {len(complete_recent)}", Fore.GREEN))
-    print(colored_text(f"Universities missing recent data: {len(incomplete)}", Fore.YELLOW))
+    lines.append(colored_text(f"\nUniversities with recent data (last 2 years): {len(complete_recent)}", Fore.GREEN))
+    lines.append(colored_text(f"Universities missing recent data: {len(incomplete)}", Fore.YELLOW))
     
     # Show missing data summary
     if missing_data:
-        print(colored_text(f"\nUniversities with gaps: {len(missing_data)}", Fore.YELLOW))
+        lines.append(colored_text(f"\nUniversities with gaps: {len(missing_data)}", Fore.YELLOW))
         
         # Show top 10 with most gaps (display names, not UKPRNs)
-        top_gaps = sorted(missing_data.items(), key=lambda x: len(x[1]), reverse=True)[:10]
-        print("\nTop 10 universities with most missing years:")
+        top_gaps = heapq.nlargest(10, missing_data.items(), key=lambda x: len(x[1]))
+        lines.append("\nTop 10 universities with most missing years:")
         for uni_key, years in top_gaps:
             # Get university name from university_data if available
             uni_info = university_data.get(uni_key, {})
@@ -1493,22 +1840,28 @@ def print_summary(university_data: Dict, missing_data: Dict):
             else:
                 display_name = uni_key
             
-            print(f"  {display_name}: {len(years)} missing years")
+            lines.append(f"  {display_name}: {len(years)} missing years")
             if len(years) <= 5:
-                print(f"    Missing: {', '.join(years)}")
+                lines.append(f"    Missing: {', '.join(map(format_financial_year, years))}")
     
-    print(colored_text("\n" + "="*80, Fore.CYAN))
+    lines.append("\n" + BANNER)
+    return "\n".join(lines)
 
 
-def print_university_summary(
+def print_summary(university_data: Dict, missing_data: Dict):
+    """Print summary of current data coverage."""
+    print(render_summary(university_data, missing_data))
+
+
+def render_university_summary(
     university_data: Dict,
     missing_data: Dict,
     csv_rows: List[Dict] = None,
     show_all: bool = False,
     limit: int = 20
-):
+) -> str:
     """
-    Print detailed summary for each university showing found and missing years.
+    Render detailed summary for each university showing found and missing years.
     
     Args:
         university_data: Dict of university data from analyze_extracted_text (keyed by UKPRN or name)
@@ -1516,31 +1869,47 @@ def print_university_summary(
         csv_rows: Optional CSV tracker rows for additional info
         show_all: If True, show all universities. If False, show only those with data
         limit: Maximum number of universities to show (default: 20)
+    
+    Returns:
+        The summary text, to be written in one go rather than line by line
     """
-    print(colored_text("\n" + "="*80, Fore.CYAN))
-    print(colored_text("University-by-University Summary", Fore.CYAN))
-    print(colored_text("="*80, Fore.CYAN))
+    lines = []
+    lines.append("\n" + BANNER)
+    lines.append(colored_text("University-by-University Summary", Fore.CYAN))
+    lines.append(BANNER)
     
     # Get all universities (from both data and missing)
-    all_unis = set(university_data.keys()) | set(missing_data.keys())
+    all_unis = university_data.keys() | missing_data.keys()
     
     if not all_unis:
-        print(colored_text("\nNo university data available.", Fore.YELLOW))
-        return
+        lines.append(colored_text("\nNo university data available.", Fore.YELLOW))
+        return "\n".join(lines)
     
-    # Sort by university name (get name from university_data if available)
-    def sort_key(key):
+    # Sort by university name (get name from university_data if available),
+    # resolving each name once rather than on every comparison
+    names_by_key = {}
+    for key in all_unis:
         uni_info = university_data.get(key, {})
-        return uni_info.get('name', key) if isinstance(uni_info, dict) else key
+        names_by_key[key] = uni_info.get('name', key) if isinstance(uni_info, dict) else key
     
-    sorted_unis = sorted(all_unis, key=sort_key)
+    # Limit output if requested (partial selection instead of a full sort)
+    if not show_all and len(all_unis) > limit:
+        lines.append(f"\nShowing first {limit} universities (use --show-all-unis for complete list)")
+        sorted_unis = heapq.nsmallest(limit, all_unis, key=names_by_key.__getitem__)
+    else:
+        sorted_unis = sorted(all_unis, key=names_by_key.__getitem__)
     
-    # Limit output if requested
-    if not show_all and len(sorted_unis) > limit:
-        print(f"\nShowing first {limit} universities (use --show-all-unis for complete list)")
-        sorted_unis = sorted_unis[:limit]
+    lines.append(f"\nTotal universities: {len(all_unis)}\n")
     
-    print(f"\nTotal universities: {len(all_unis)}\n")
+    # Aggregate CSV counts in one pass instead of rescanning rows per university
+    txt_counts = Counter()
+    placeholder_counts = Counter()
+    if csv_rows:
+        for row in csv_rows:
+            if row['txt_path']:
+                txt_counts[row['university']] += 1
+            if not row['pdf_path']:
+                placeholder_counts[(row['university'], row['year'])] += 1
     
     for idx, uni_key in enumerate(sorted_unis, 1):
         # Get data for this university
@@ -1556,53 +1925,66 @@ def print_university_summary(
         else:
             display_name = uni_name
         
-        print(colored_text(f"\n{idx}. {display_name}", Fore.CYAN))
-        print("-" * 70)
+        lines.append(colored_text(f"\n{idx}. {display_name}", Fore.CYAN))
+        lines.append("-" * 70)
         
         # Found years
         if uni_data and uni_data.get('years'):
-            years_list = sorted(list(uni_data['years']))
+            years_list = tuple(sorted(uni_data['years']))
             year_ranges = format_year_ranges(years_list)
             
-            print(colored_text(f"  ✓ Found: {len(years_list)} years", Fore.GREEN))
-            print(f"    Range: {uni_data.get('min_year', 'N/A')} to {uni_data.get('max_year', 'N/A')}")
-            print(f"    Years: {year_ranges}")
-            print(f"    Files: {len(uni_data.get('files', []))} documents")
+            lines.append(colored_text(f"  ✓ Found: {len(years_list)} years", Fore.GREEN))
+            lines.append(f"    Range: {uni_data.get('min_year', 'N/A')} to {uni_data.get('max_year', 'N/A')}")
+            lines.append(f"    Years: {year_ranges}")
+            lines.append(f"    Files: {len(uni_data.get('files', []))} documents")
             
             # Count from CSV if available
             if csv_rows:
-                csv_count = sum(1 for row in csv_rows 
-                              if row['university'] == uni_name and row.get('txt_path'))
+                csv_count = txt_counts[uni_name]
                 if csv_count != len(uni_data.get('files', [])):
-                    print(f"    CSV records: {csv_count} documents")
+                    lines.append(f"    CSV records: {csv_count} documents")
         else:
-            print(colored_text("  ✗ No documents found yet", Fore.YELLOW))
+            lines.append(colored_text("  ✗ No documents found yet", Fore.YELLOW))
         
         # Missing years
         if missing_years:
             # Group consecutive years
+            missing_years = tuple(map(format_financial_year, missing_years))
             missing_ranges = format_year_ranges(missing_years)
-            print(colored_text(f"  ⚠ Missing: {len(missing_years)} years", Fore.YELLOW))
-            print(f"    Years: {missing_ranges}")
+            lines.append(colored_text(f"  ⚠ Missing: {len(missing_years)} years", Fore.YELLOW))
+            lines.append(f"    Years: {missing_ranges}")
             
             # Show placeholders in CSV if available
             if csv_rows:
-                placeholder_count = sum(1 for row in csv_rows 
-                                       if row['university'] == uni_name 
-                                       and row['year'] in missing_years
-                                       and not row.get('pdf_path'))
+                placeholder_count = sum(placeholder_counts[(uni_name, year)] for year in set(missing_years))
                 if placeholder_count > 0:
-                    print(f"    CSV placeholders: {placeholder_count} rows")
+                    lines.append(f"    CSV placeholders: {placeholder_count} rows")
         else:
             if uni_data and uni_data.get('years'):
-                print(colored_text("  ✓ No missing years in range", Fore.GREEN))
+                lines.append(colored_text("  ✓ No missing years in range", Fore.GREEN))
     
-    print(colored_text("\n" + "="*80, Fore.CYAN))
+    lines.append("\n" + BANNER)
+    return "\n".join(lines)
+
+
+def print_university_summary(
+    university_data: Dict,
+    missing_data: Dict,
+    csv_rows: List[Dict] = None,
+    show_all: bool = False,
+    limit: int = 20
+):
+    """Print detailed summary for each university (see render_university_summary)."""
+    print(render_university_summary(university_data, missing_data, csv_rows, show_all, limit))
 
 
-def format_year_ranges(years: List[str]) -> str:
+@lru_cache(maxsize=1024)
+def format_year_ranges(years: Tuple[str, ...]) -> str:
     """
-    Format a list of years into readable ranges.
+    Format a sequence of years into readable ranges.
+    
+    Takes a tuple so results can be cached across universities with the
+    same year set.
     
     Examples:
         ['2020-21', '2021-22', '2022-23'] -> '2020-21 to 2022-23'
@@ -1631,27 +2013,12 @@ def format_year_ranges(years: List[str]) -> str:
     
     year_ints.sort()
     
-    # Find consecutive ranges
+    # Find consecutive ranges: year - index is constant within a run
     ranges = []
-    start = year_ints[0]
-    end = year_ints[0]
-    
-    for year in year_ints[1:]:
-        if year == end + 1:
-            end = year
-        else:
-            # Add completed range
-            if start == end:
-                ranges.append(str(start))
-            else:
-                ranges.append(f"{start}-{end}")
-            start = end = year
-    
-    # Add final range
-    if start == end:
-        ranges.append(str(start))
-    else:
-        ranges.append(f"{start}-{end}")
+    for _, run in groupby(enumerate(year_ints), key=lambda p: p[1] - p[0]):
+        run = list(run)
+        start, end = run[0][1], run[-1][1]
+        ranges.append(str(start) if start == end else f"{start}-{end}")
     
     # Format nicely
     if len(ranges) == 1:
@@ -1721,6 +2088,23 @@ Examples:
         help='Number of universities to process per iteration (default: 5)'
     )
     
+    parser.add_argument(
+        '--download-workers',
+        type=int,
+        default=4,
+        help=('Number of download processes to run concurrently (default: 4). '
+              'Their DuckDuckGo searches share one pace of a search every 2s '
+              '(via a lock file) where fcntl is available; elsewhere each process '
+              'paces itself, so the query rate grows with this number')
+    )
+    
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=max(2, int((os.cpu_count() or 1) * 1.5)),
+        help='Number of PDF extraction worker processes (default: 1.5x CPU count)'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -1751,9 +2135,9 @@ Examples:
     setup_logging(args.verbose)
     
     # Print header
-    print(colored_text("\n" + "="*80, Fore.CYAN))
+    print("\n" + BANNER)
     print(colored_text("Financial Data Collection Coordinator", Fore.CYAN))
-    print(colored_text("="*80 + "\n", Fore.CYAN))
+    print(BANNER + "\n")
     
     # Set directories - use iCloud storage by default
     if args.downloads is None:
@@ -1779,13 +2163,16 @@ Examples:
     logging.info("\nStep 0: Loading CSV tracker...")
     csv_rows = load_csv_tracker(csv_tracker_path)
     
+    # List and parse the extracted directory once for the CSV update and analysis
+    extracted_index = scan_extracted_dir(args.extracted)
+    
     # Update CSV with any existing extracted files
-    csv_rows = update_csv_with_extracted_files(csv_rows, args.extracted)
+    csv_rows = update_csv_with_extracted_files(csv_rows, args.extracted, index=extracted_index)
     save_csv_tracker(csv_tracker_path, csv_rows)
     
     # Step 1: Analyze current data
     logging.info("\nStep 1: Analyzing extracted text files...")
-    university_data = analyze_extracted_text(args.extracted)
+    university_data = analyze_extracted_text(args.extracted, index=extracted_index)
     
     if not university_data:
         logging.warning("No extracted text found. Please run extraction first.")
@@ -1809,8 +2196,7 @@ Examples:
     
     # Add placeholder rows for missing years
     logging.info("\nAdding placeholders for missing years to CSV...")
-    for uni_name, years in missing_data.items():
-        csv_rows = add_placeholder_rows(csv_rows, uni_name, years)
+    csv_rows = add_placeholder_rows_batch(csv_rows, missing_data)
     save_csv_tracker(csv_tracker_path, csv_rows)
     logging.info(f"CSV tracker now has {len(csv_rows)} total rows")
     
@@ -1847,7 +2233,7 @@ Examples:
             else:
                 print(colored_text(f"\n{uni_name} (⚠️  no domain filtering)", Fore.YELLOW))
             
-            for year in years[:3]:  # Show first 3 missing years per uni
+            for year in map(format_financial_year, years[:3]):  # Show first 3 missing years per uni
                 query = generate_search_query(uni_name, year, ukprn, domains)
                 print(f"  Would search: {query}")
                 search_count += 1
@@ -1873,10 +2259,10 @@ Examples:
             logging.info(f"Domains: {', '.join(domains[:3])}")
         else:
             logging.warning(f"⚠️  No domain filtering available for {uni_name}")
-        logging.info(f"Missing years: {', '.join(years[:5])}{'...' if len(years) > 5 else ''}")
+        logging.info(f"Missing years: {', '.join(map(format_financial_year, years[:5]))}{'...' if len(years) > 5 else ''}")
         
         # Queue searches for earliest missing years
-        for year in years[:3]:  # Try first 3 missing years
+        for year in map(format_financial_year, years[:3]):  # Try first 3 missing years
             query = generate_search_query(uni_name, year, ukprn, domains)
             all_queries.append((uni_name, year, query))
     
@@ -1884,31 +2270,43 @@ Examples:
     
     # Step 6: Download ALL documents
     logging.info(f"\nStep 4: Downloading documents for all searches...")
-    print(colored_text(f"\n{'='*80}", Fore.CYAN))
+    print("\n" + BANNER)
     print(colored_text("Downloading Phase", Fore.CYAN))
-    print(colored_text(f"{'='*80}\n", Fore.CYAN))
+    print(BANNER + "\n")
+    
+    # List the queued searches in one console write. The per-query record
+    # goes to the log file only (DEBUG) since the console line already shows it
+    listing = []
+    for idx, (uni_name, year, query) in enumerate(all_queries, 1):
+        listing.append(colored_text(f"[{idx}/{len(all_queries)}] {uni_name} - {year}", Fore.CYAN))
+        listing.append(colored_text(f"  🔍 Search query: {query}", Fore.CYAN))
+        logging.debug(f"Searching: {query}")
+    if listing:
+        print("\n".join(listing))
+    
+    # Split the searches into one batch per worker, keeping each university's
+    # searches together, and run the step1 processes concurrently
+    queries_by_uni = defaultdict(list)
+    for entry in all_queries:
+        queries_by_uni[entry[0]].append(entry)
+    
+    num_batches = max(1, min(args.download_workers, len(queries_by_uni)))
+    batches = [[] for _ in range(num_batches)]
+    for i, uni_queries in enumerate(queries_by_uni.values()):
+        batches[i % num_batches].extend(uni_queries)
+    batches = [batch for batch in batches if batch]
     
     successful_downloads = 0
-    
-    # Create progress bar for downloads
-    if TQDM_AVAILABLE:
-        query_iterator = tqdm(all_queries, desc="Searching & Downloading", unit="query")
-    else:
-        query_iterator = all_queries
-    
-    for idx, (uni_name, year, query) in enumerate(query_iterator, 1):
-        if not TQDM_AVAILABLE:
-            print(colored_text(f"\n[{idx}/{len(all_queries)}] {uni_name} - {year}", Fore.CYAN))
-        else:
-            # Update tqdm description with current university
-            query_iterator.set_description(f"[{idx}/{len(all_queries)}] {uni_name} - {year}")
-            print()  # Newline for cleaner output
-            print(colored_text(f"[{idx}/{len(all_queries)}] {uni_name} - {year}", Fore.CYAN))
-        
-        logging.info(f"Searching: {query}")
-        
-        if run_download_script(query, args.downloads, limit=5):
-            successful_downloads += 1
+    with ThreadPoolExecutor(max_workers=max(1, len(batches))) as executor:
+        futures = {
+            executor.submit(run_download_script_batch, batch, args.downloads, 5): batch
+            for batch in batches
+        }
+        for idx, future in enumerate(as_completed(futures), 1):
+            batch = futures[future]
+            if future.result():
+                successful_downloads += len(batch)
+            print(colored_text(f"[{idx}/{len(batches)}] Finished batch of {len(batch)} searches", Fore.CYAN))
     
     print(colored_text(f"\n✓ Completed {successful_downloads}/{len(all_queries)} successful searches", Fore.GREEN))
     logging.info(f"\nDownloaded from {successful_downloads}/{len(all_queries)} searches")
@@ -1921,40 +2319,48 @@ Examples:
     
     # Step 7: Extract ALL PDFs at once
     if successful_downloads > 0:
-        print(colored_text(f"\n{'='*80}", Fore.CYAN))
+        print("\n" + BANNER)
         print(colored_text("Extraction Phase", Fore.CYAN))
-        print(colored_text(f"{'='*80}\n", Fore.CYAN))
+        print(BANNER + "\n")
         
         # Count PDFs to extract
-        pdf_files = list(args.downloads.glob("*.pdf"))
-        logging.info(f"Found {len(pdf_files)} PDF files to extract")
+        pdf_count = count_pdf_files(args.downloads)
+        logging.info(f"Found {pdf_count} PDF files to extract")
         
-        if pdf_files:
+        if pdf_count:
             logging.info("\nExtracting text from all PDFs (format: both txt and json)...")
             run_extraction_script(
                 args.downloads,
                 args.extracted,
                 fast_mode=True,
-                workers=4,
+                workers=args.extract_workers,
                 output_format='both'  # Extract both txt and json
             )
-            
-            # Update CSV with extracted files
-            logging.info("\nUpdating CSV tracker with extracted files...")
-            csv_rows = update_csv_with_extracted_files(csv_rows, args.extracted)
-            save_csv_tracker(csv_tracker_path, csv_rows)
+            # New extracted files are added to the CSV by the final update below
         else:
             logging.warning("No PDF files found in downloads directory")
     else:
         logging.warning("No successful downloads. Nothing to extract.")
     
     # Final summary
-    print(colored_text("\n" + "="*80, Fore.CYAN))
+    print("\n" + BANNER)
     print(colored_text("Coordination Complete", Fore.CYAN))
-    print(colored_text("="*80, Fore.CYAN))
+    print(BANNER)
     
-    university_data = analyze_extracted_text(args.extracted)
-    missing_data = identify_missing_years(university_data, max_lookback=args.max_lookback, max_forward=2)
+    # Rescan once (picking up newly extracted files) for both the CSV and the summary
+    final_index = scan_extracted_dir(args.extracted)
+    
+    logging.info("\nFinal CSV tracker update...")
+    csv_rows = update_csv_with_extracted_files(csv_rows, args.extracted, index=final_index)
+    save_csv_tracker(csv_tracker_path, csv_rows)
+    
+    # The scan cache returns the same index when the directory is unchanged
+    # (e.g. nothing was downloaded), and then the step 1-2 results still hold
+    if final_index is not extracted_index:
+        university_data = analyze_extracted_text(args.extracted, index=final_index)
+        missing_data = identify_missing_years(university_data, max_lookback=args.max_lookback, max_forward=2)
+    else:
+        logging.debug("Extracted text unchanged since analysis; reusing results")
     print_summary(university_data, missing_data)
     
     # Show detailed university summary
@@ -1966,11 +2372,6 @@ Examples:
         limit=10
     )
     
-    # Final CSV update
-    logging.info("\nFinal CSV tracker update...")
-    csv_rows = update_csv_with_extracted_files(csv_rows, args.extracted)
-    save_csv_tracker(csv_tracker_path, csv_rows)
-    
     print(colored_text(f"\n📊 CSV Tracker: {csv_tracker_path} ({len(csv_rows)} rows)", Fore.GREEN))
     print(colored_text(f"💡 Tip: Run with --summary to see detailed breakdown for all universities", Fore.CYAN))
     
@@ -15,18 +15,27 @@ from __future__ import annotations
 
 import argparse
 import csv
+import fnmatch
+import glob
 import hashlib
 import json
 import logging
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import Iterator, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 
 # Optional imports with graceful fallbacks
 try:
@@ -52,6 +61,9 @@ try:
     import requests
     from requests.adapters import HTTPAdapter
     from urllib3.util.retry import Retry
+    # Encodings urllib3 can actually decode here: includes br/zstd only
+    # when brotli/zstandard are installed
+    from urllib3.util.request import ACCEPT_ENCODING
     _HAVE_REQUESTS = True
 except ImportError:
     _HAVE_REQUESTS = False
@@ -62,6 +74,20 @@ try:
 except ImportError:
     _HAVE_BS4 = False
 
+# Optional faster parsers for page scraping: selectolax (lexbor, C) is preferred,
+# otherwise BeautifulSoup uses lxml if installed instead of html.parser
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _HAVE_SELECTOLAX = True
+except ImportError:
+    _HAVE_SELECTOLAX = False
+
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
+
 try:
     from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
     _HAVE_PLAYWRIGHT = True
@@ -74,14 +100,149 @@ try:
 except ImportError:
     _HAVE_DDGS = False
 
+try:
+    import fcntl
+    _HAVE_FCNTL = True
+except ImportError:
+    _HAVE_FCNTL = False
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
 
 # Global logger
 logger: logging.Logger = None
 
+# Number of concurrent requests downloads per run; HostThrottle keeps the
+# load on any one server polite
+DOWNLOAD_THREADS = 8
+
+# DuckDuckGo searches start at least SEARCH_MIN_INTERVAL seconds apart. The
+# run coordinator starts several step1 processes at once and DuckDuckGo rate
+# limits by client IP, so the next allowed start time is shared through a
+# file in the temp directory rather than kept per process
+SEARCH_MIN_INTERVAL = 2.0
+SEARCH_PACE_FILE = os.path.join(tempfile.gettempdir(), "uk_university_financials_ddg.pace")
+_next_local_search_start = 0.0
+
+# Successful downloads between full rewrites of the download state file;
+# in between, each download is only appended to this process's journal
+STATE_CHECKPOINT_INTERVAL = 50
+
+# Leading bytes of a download checked for the PDF signature; the spec lets
+# "%PDF-" appear anywhere in the first 1024 bytes
+PDF_SNIFF_BYTES = 1024
+
+# Scraped financial pages are read in SCRAPE_CHUNK_SIZE pieces and only
+# the first MAX_SCRAPE_PAGE_BYTES are parsed
+SCRAPE_CHUNK_SIZE = 64 * 1024
+MAX_SCRAPE_PAGE_BYTES = 5 << 20
+
+# Separator logged before each document
+_RULE = f"{Fore.CYAN}{'=' * 80}{Style.RESET_ALL}"
+
+# Read/write size for streamed downloads. Annual reports are typically
+# several MB, so 1 MiB chunks keep the write() count per file small.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Used by FinancialDocument.get_safe_filename
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^\w\s-]')
+_NAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+_SAFE_NAME_FILE_TYPES = frozenset({'pdf', 'docx', 'xlsx', 'html', 'zip'})
+
+# Used by is_financial_document, which runs once per link on every scraped
+# page; each keyword list is matched as a single compiled alternation
+
+# File extensions to look for
+_DOC_EXTENSIONS = ('.pdf', '.docx', '.doc', '.xlsx', '.xls')
+
+# Strong indicators of official annual reports - require at least one
+_OFFICIAL_INDICATORS = (
+    'annual-report-and-accounts', 'annual_report_and_accounts',
+    'annual-report-accounts', 'annual_report_accounts',
+    'financial-statements', 'financial_statements',
+    'report-and-accounts', 'report_and_accounts',
+    'annual-accounts', 'annual_accounts',
+    '/governance/', '/about/reports/', '/finance/',
+    '/corporate/', '/publications/annual',
+)
 
-@dataclass
+# Weaker financial keywords - only use if combined with other signals
+_FINANCIAL_KEYWORDS = (
+    'annual report', 'financial statement', 'accounts',
+    'statutory accounts', 'consolidated accounts'
+)
+
+# EXCLUDE patterns - academic/research content that is NOT official reports
+_EXCLUDE_PATTERNS = (
+    # Academic repositories and research
+    'repository', 'eprint', 'dspace', 'handle.net', 'research.',
+    '/research/', 'publications/research', 'pure.', 'openaccess',
+    # Student/thesis content
+    'thesis', 'dissertation', 'student', 'coursework', 'assignment',
+    'essay', '/students/', 'module', 'degree',
+    # Economics/academic papers
+    'working-paper', 'working_paper', 'discussion-paper',
+    'economics', 'economist', 'faculty', 'journal', 'article',
+    # Administrative/other
+    'course', 'prospectus', 'login', 'portal', 'admissions',
+    'apply', 'news', 'blog', 'press-release', 'event',
+    # File patterns for non-reports
+    'cv.pdf', 'resume', 'syllabus', 'handbook', 'guide',
+)
+
+
+def _substring_re(substrings) -> "re.Pattern":
+    """Compile a pattern matching any of the given literal substrings."""
+    return re.compile('|'.join(map(re.escape, substrings)))
+
+
+# Used by search_for_documents on each search result
+
+# Domain filter given as a site: operator in the query
+_SITE_OPERATOR_RE = re.compile(r'site:([^\s]+)')
+
+# Academic/research content that is NOT official annual reports; these are
+# common patterns in academic repositories and research papers
+_SEARCH_EXCLUDE_URL_PATTERNS = (
+    'repository', 'eprint', 'dspace', 'handle.net', '/research/',
+    'openaccess', 'pure.', '/publications/research', 'working-paper',
+    'discussion-paper', 'thesis', 'dissertation', '/student',
+    'faculty', 'journal', 'article', 'conference', 'proceedings',
+)
+
+_SEARCH_EXCLUDE_TITLE_PATTERNS = (
+    'thesis', 'dissertation', 'working paper', 'discussion paper',
+    'research paper', 'economics', 'economist', 'phd', 'doctoral',
+    'master', 'undergraduate', 'faculty', 'journal', 'article',
+    'conference', 'proceedings', 'lecture', 'seminar',
+)
+
+# Official report indicators, preferred in search results
+_SEARCH_OFFICIAL_INDICATORS = (
+    'annual-report', 'annual_report', 'financial-statement',
+    'report-and-accounts', 'governance', '/about/', '/corporate/',
+    '/finance/', 'statutory', 'accounts'
+)
+
+_OFFICIAL_INDICATOR_RE = _substring_re(_OFFICIAL_INDICATORS)
+_FINANCIAL_KEYWORD_RE = _substring_re(_FINANCIAL_KEYWORDS)
+_EXCLUDE_RE = _substring_re(_EXCLUDE_PATTERNS)
+_SEARCH_EXCLUDE_URL_RE = _substring_re(_SEARCH_EXCLUDE_URL_PATTERNS)
+_SEARCH_EXCLUDE_TITLE_RE = _substring_re(_SEARCH_EXCLUDE_TITLE_PATTERNS)
+_SEARCH_OFFICIAL_RE = _substring_re(_SEARCH_OFFICIAL_INDICATORS)
+
+
+@dataclass(slots=True)
 class FinancialDocument:
-    """Represents a financial document to download."""
+    """Represents a financial document to download.
+    
+    Slotted (no per-instance ``__dict__``) since large runs hold many
+    thousands of these.
+    """
     university: str
     url: str
     year: Optional[str] = None
@@ -99,8 +260,9 @@ class FinancialDocument:
             if path:
                 self.filename = os.path.basename(path)
             else:
-                # Create filename from URL hash
-                url_hash = hashlib.md5(self.url.encode()).hexdigest()[:8]
+                # Create filename from URL hash (an identifier only, so md5 is
+                # fine; it must stay stable across runs and installs)
+                url_hash = hashlib.md5(self.url.encode(), usedforsecurity=False).hexdigest()[:8]
                 self.filename = f"{url_hash}.pdf"
         
         if not self.file_type and self.filename:
@@ -110,20 +272,77 @@ class FinancialDocument:
     def get_safe_filename(self) -> str:
         """Generate a safe filename for saving."""
         # Sanitize university name
-        safe_uni = re.sub(r'[^\w\s-]', '', self.university)
-        safe_uni = re.sub(r'[-\s]+', '_', safe_uni).strip('_')
+        safe_uni = _safe_university_name(self.university)
         
         # Add year if available
         year_part = f"_{self.year}" if self.year and self.year != 'N/A' else ""
         
         # Keep original filename if it has a reasonable extension
-        if self.file_type in ['pdf', 'docx', 'xlsx', 'html', 'zip']:
+        if self.file_type in _SAFE_NAME_FILE_TYPES:
             return f"{safe_uni}{year_part}_{self.filename}"
         else:
             return f"{safe_uni}{year_part}.pdf"
 
 
-def search_for_documents(query: str, max_results: int = 10) -> List[FinancialDocument]:
+@lru_cache(maxsize=1024)
+def _safe_university_name(university: str) -> str:
+    """Filename-safe form of a university name.
+    
+    Cached because every document of a university shares it and a
+    document's safe filename is computed several times per download.
+    """
+    safe_uni = _UNSAFE_NAME_CHARS_RE.sub('', university)
+    return _NAME_SEPARATORS_RE.sub('_', safe_uni).strip('_')
+
+
+def _wait_for_search_turn(pace_file: str = SEARCH_PACE_FILE,
+                          interval: float = SEARCH_MIN_INTERVAL) -> None:
+    """Block until a DuckDuckGo search may start.
+    
+    The pace file holds the wall-clock time at which the next search may
+    start. It is read and advanced under an exclusive lock, so searches
+    from every process sharing it are at least ``interval`` seconds apart.
+    Without fcntl (e.g. on Windows), or if the file cannot be used, only
+    this process's own searches are spaced.
+    
+    Parameters
+    ----------
+    pace_file : str
+        Path of the shared pace file
+    interval : float
+        Minimum seconds between search starts
+    """
+    global _next_local_search_start
+    now = time.time()
+    start = None
+    if _HAVE_FCNTL:
+        try:
+            with open(pace_file, 'a+', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        next_start = float(f.read().strip() or 0)
+                    except ValueError:
+                        next_start = 0.0
+                    now = time.time()
+                    start = max(now, next_start)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(repr(start + interval))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        except OSError as e:
+            logger.debug(f"Search pace file unavailable ({e}); pacing this process only")
+    if start is None:
+        start = max(now, _next_local_search_start)
+    _next_local_search_start = start + interval
+    if start > now:
+        time.sleep(start - now)
+
+
+def search_for_documents(query: str, max_results: int = 10, ddgs: Optional["DDGS"] = None) -> List[FinancialDocument]:
     """
     Search for financial documents using DuckDuckGo search.
     
@@ -133,6 +352,8 @@ def search_for_documents(query: str, max_results: int = 10) -> List[FinancialDoc
         Search query (e.g., "University of Edinburgh 2020-21 annual report")
     max_results : int
         Maximum number of results to return
+    ddgs : Optional[DDGS]
+        Open search client to reuse across queries (a new one is created if None)
         
     Returns
     -------
@@ -155,99 +376,83 @@ def search_for_documents(query: str, max_results: int = 10) -> List[FinancialDoc
         expected_domain = None
         if 'site:' in query:
             # Extract domain from site: operator
-            import re
-            domain_match = re.search(r'site:([^\s]+)', query)
+            domain_match = _SITE_OPERATOR_RE.search(query)
             if domain_match:
                 expected_domain = domain_match.group(1).lower()
                 logger.info(f"Domain filtering enabled: {expected_domain}")
                 print(f"{Fore.YELLOW}  Domain filter: {expected_domain}{Style.RESET_ALL}")
         
-        with DDGS(timeout=20) as ddgs:
-            # Get more results than needed to filter for PDFs
-            search_limit = max_results * 5  # Get 5x results to ensure enough PDFs
+        # Get more results than needed to filter for PDFs
+        search_limit = max_results * 5  # Get 5x results to ensure enough PDFs
+        # Respect rate limits, shared with other step1 processes
+        _wait_for_search_turn()
+        if ddgs is None:
+            with DDGS(timeout=20) as client:
+                results = list(client.text(search_query, max_results=search_limit))
+        else:
             results = list(ddgs.text(search_query, max_results=search_limit))
+        
+        logger.debug(f"Got {len(results)} total results from search")
+        print(f"{Fore.BLUE}  Got {len(results)} total results, filtering for PDFs...{Style.RESET_ALL}")
+        
+        for result in results:
+            url = result.get('href', '')
+            title = result.get('title', '')
             
-            logger.debug(f"Got {len(results)} total results from search")
-            print(f"{Fore.BLUE}  Got {len(results)} total results, filtering for PDFs...{Style.RESET_ALL}")
-            
-            for result in results:
-                url = result.get('href', '')
-                title = result.get('title', '')
+            # Check if URL contains .pdf (case insensitive)
+            if url and '.pdf' in url.lower():
+                url_lower = url.lower()
+                title_lower = title.lower()
                 
-                # Check if URL contains .pdf (case insensitive)
-                if url and '.pdf' in url.lower():
-                    url_lower = url.lower()
-                    title_lower = title.lower()
-                    
-                    # Domain validation if expected_domain is set
-                    if expected_domain:
-                        # Check if URL contains the expected domain
-                        if expected_domain not in url_lower:
-                            logger.debug(f"Skipping PDF from wrong domain: {url}")
-                            print(f"{Fore.RED}  ✗ Skipped (wrong domain): {title[:50]}...{Style.RESET_ALL}")
-                            continue
-                    
-                    # Filter out academic/research content that is NOT official annual reports
-                    # These are common patterns in academic repositories and research papers
-                    exclude_url_patterns = [
-                        'repository', 'eprint', 'dspace', 'handle.net', '/research/',
-                        'openaccess', 'pure.', '/publications/research', 'working-paper',
-                        'discussion-paper', 'thesis', 'dissertation', '/student',
-                        'faculty', 'journal', 'article', 'conference', 'proceedings',
-                    ]
-                    
-                    exclude_title_patterns = [
-                        'thesis', 'dissertation', 'working paper', 'discussion paper',
-                        'research paper', 'economics', 'economist', 'phd', 'doctoral',
-                        'master', 'undergraduate', 'faculty', 'journal', 'article',
-                        'conference', 'proceedings', 'lecture', 'seminar',
-                    ]
-                    
-                    is_excluded_url = any(pattern in url_lower for pattern in exclude_url_patterns)
-                    is_excluded_title = any(pattern in title_lower for pattern in exclude_title_patterns)
-                    
-                    if is_excluded_url or is_excluded_title:
-                        reason = "academic/research content" if is_excluded_url else "research title"
-                        logger.debug(f"Skipping non-official PDF ({reason}): {url}")
-                        print(f"{Fore.RED}  ✗ Skipped ({reason}): {title[:50]}...{Style.RESET_ALL}")
+                # Domain validation if expected_domain is set
+                if expected_domain:
+                    # Check if URL contains the expected domain
+                    if expected_domain not in url_lower:
+                        logger.debug(f"Skipping PDF from wrong domain: {url}")
+                        print(f"{Fore.RED}  ✗ Skipped (wrong domain): {title[:50]}...{Style.RESET_ALL}")
                         continue
-                    
-                    # Prefer URLs with official report indicators
-                    official_indicators = [
-                        'annual-report', 'annual_report', 'financial-statement',
-                        'report-and-accounts', 'governance', '/about/', '/corporate/',
-                        '/finance/', 'statutory', 'accounts'
-                    ]
-                    has_official_indicator = any(ind in url_lower for ind in official_indicators)
-                    
-                    # Log whether it looks official
-                    if has_official_indicator:
-                        logger.debug(f"Found official-looking PDF: {title}")
-                    else:
-                        logger.debug(f"Found PDF (no official indicators): {title}")
-                    
-                    # Extract university name from query (first few words)
-                    uni_name = ' '.join(query.split()[0:3])
-                    
-                    doc = FinancialDocument(
-                        university=uni_name,
-                        url=url,
-                        source='search'
-                    )
-                    documents.append(doc)
-                    
-                    # Extract filename from URL
-                    filename = url.split('/')[-1].split('?')[0]
-                    
-                    logger.debug(f"Found PDF: {title} - {url}")
-                    print(f"{Fore.GREEN}  Found PDF #{len(documents)}:{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}    Title: {title}{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}    Filename: {filename}{Style.RESET_ALL}")
-                    print(f"{Fore.BLUE}    URL: {url}{Style.RESET_ALL}")
-                    
-                    if len(documents) >= max_results:
-                        break
-        
+                
+                # Filter out academic/research content that is NOT official annual reports
+                is_excluded_url = _SEARCH_EXCLUDE_URL_RE.search(url_lower) is not None
+                is_excluded_title = _SEARCH_EXCLUDE_TITLE_RE.search(title_lower) is not None
+                
+                if is_excluded_url or is_excluded_title:
+                    reason = "academic/research content" if is_excluded_url else "research title"
+                    logger.debug(f"Skipping non-official PDF ({reason}): {url}")
+                    print(f"{Fore.RED}  ✗ Skipped ({reason}): {title[:50]}...{Style.RESET_ALL}")
+                    continue
+                
+                # Prefer URLs with official report indicators
+                has_official_indicator = _SEARCH_OFFICIAL_RE.search(url_lower) is not None
+                
+                # Log whether it looks official
+                if has_official_indicator:
+                    logger.debug(f"Found official-looking PDF: {title}")
+                else:
+                    logger.debug(f"Found PDF (no official indicators): {title}")
+                
+                # Extract university name from query (first few words)
+                uni_name = ' '.join(query.split()[0:3])
+                
+                doc = FinancialDocument(
+                    university=uni_name,
+                    url=url,
+                    source='search'
+                )
+                documents.append(doc)
+                
+                # Extract filename from URL
+                filename = url.split('/')[-1].split('?')[0]
+                
+                logger.debug(f"Found PDF: {title} - {url}")
+                print(f"{Fore.GREEN}  Found PDF #{len(documents)}:{Style.RESET_ALL}")
+                print(f"{Fore.CYAN}    Title: {title}{Style.RESET_ALL}")
+                print(f"{Fore.YELLOW}    Filename: {filename}{Style.RESET_ALL}")
+                print(f"{Fore.BLUE}    URL: {url}{Style.RESET_ALL}")
+                
+                if len(documents) >= max_results:
+                    break
+
         if documents:
             logger.info(f"Found {len(documents)} PDF documents for query: {query}")
             print(f"{Fore.GREEN}\u2713 Found {len(documents)} PDF document(s){Style.RESET_ALL}")
@@ -255,10 +460,6 @@ def search_for_documents(query: str, max_results: int = 10) -> List[FinancialDoc
             logger.info(f"No PDF documents found for query: {query}")
             print(f"{Fore.YELLOW}\u2717 No PDF documents found{Style.RESET_ALL}")
         
-        # Add delay to respect rate limits
-        if documents:
-            time.sleep(2)  # 2 second delay between searches
-        
         return documents
         
     except Exception as e:
@@ -267,8 +468,87 @@ def search_for_documents(query: str, max_results: int = 10) -> List[FinancialDoc
         return []
 
 
+def _load_json_file(path: str):
+    """Parse a JSON file, with orjson when it is installed."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read()) if _HAVE_ORJSON else json.load(f)
+
+
+def _save_json_file(data, path: str) -> None:
+    """Write data as JSON indented by 2, with orjson when it is installed."""
+    if _HAVE_ORJSON:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(encoded)
+
+
+def _state_journal_pattern(state_file: str) -> str:
+    """Glob pattern matching every process's journal for a state file."""
+    return f"{os.path.splitext(state_file)[0]}.*.jsonl"
+
+
+def _state_journal_path(state_file: str) -> str:
+    """Journal file this process appends downloads to."""
+    return f"{os.path.splitext(state_file)[0]}.{os.getpid()}.jsonl"
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this PID exists (POSIX only)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+def _remove_stale_journals(state_file: str) -> None:
+    """Delete journals left by downloader processes that are no longer running.
+    
+    Must be called with the state file lock held, after their entries have
+    been written to the state file. Only done where fcntl is available:
+    there the lock is real, and signal 0 only probes the PID (on Windows
+    os.kill would terminate the process).
+    """
+    if not _HAVE_FCNTL:
+        return
+    for journal in glob.glob(_state_journal_pattern(state_file)):
+        pid_text = journal[:-len('.jsonl')].rsplit('.', 1)[-1]
+        if not pid_text.isdigit():
+            continue
+        pid = int(pid_text)
+        if pid == os.getpid() or _pid_alive(pid):
+            continue
+        try:
+            os.remove(journal)
+            logger.debug(f"Removed state journal of finished process {pid}")
+        except OSError as e:
+            logger.warning(f"Could not remove state journal {journal}: {e}")
+
+
+@contextmanager
+def _state_file_lock(state_file: str):
+    """Hold an exclusive lock on the state file while it is rewritten.
+    
+    Several downloader processes (one per coordinator batch) share a state
+    file. Without fcntl (e.g. on Windows) this is a no-op.
+    """
+    if not _HAVE_FCNTL:
+        yield
+        return
+    with open(f"{state_file}.lock", 'a') as lock_f:
+        fcntl.flock(lock_f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+
 def load_download_state(state_file: str = "download_state.json") -> dict:
-    """Load the download state from a JSON file.
+    """Load the download state from a JSON file and any pending journals.
     
     Parameters
     ----------
@@ -280,24 +560,68 @@ def load_download_state(state_file: str = "download_state.json") -> dict:
     dict
         Dictionary with 'downloaded_urls' set and 'downloaded_files' set
     """
+    downloaded_urls = set()
+    downloaded_files = set()
+    
     if os.path.exists(state_file):
         try:
-            with open(state_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return {
-                    'downloaded_urls': set(data.get('downloaded_urls', [])),
-                    'downloaded_files': set(data.get('downloaded_files', []))
-                }
+            data = _load_json_file(state_file)
+            downloaded_urls.update(data.get('downloaded_urls', []))
+            downloaded_files.update(data.get('downloaded_files', []))
         except Exception as e:
             logger.warning(f"Could not load state file: {e}")
     
-    return {'downloaded_urls': set(), 'downloaded_files': set()}
+    # Downloads appended since the last checkpoint (possibly by a process
+    # that stopped before writing one)
+    loads = orjson.loads if _HAVE_ORJSON else json.loads
+    for journal in glob.glob(_state_journal_pattern(state_file)):
+        try:
+            with open(journal, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        continue  # Partially written last line
+                    downloaded_urls.add(entry['url'])
+                    downloaded_files.add(entry['file'])
+        except OSError as e:
+            logger.warning(f"Could not read state journal {journal}: {e}")
+    
+    return {'downloaded_urls': downloaded_urls, 'downloaded_files': downloaded_files}
+
+
+def append_download_state(url: str, file_path: str, state_file: str = "download_state.json") -> None:
+    """Record one successful download in this process's state journal.
+    
+    Appending costs the size of one entry rather than the whole state, so
+    this is called after every download; save_download_state folds the
+    journal into the state file periodically.
+    
+    Parameters
+    ----------
+    url : str
+        Downloaded URL
+    file_path : str
+        Path the document was saved to
+    state_file : str
+        Path to state file
+    """
+    try:
+        with open(_state_journal_path(state_file), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'url': url, 'file': file_path}) + "\n")
+    except OSError as e:
+        logger.error(f"Could not append to state journal: {e}")
 
 
 def save_download_state(downloaded_urls: Set[str], downloaded_files: Set[str], 
                        state_file: str = "download_state.json") -> None:
     """Save the download state to a JSON file.
     
+    Entries already in the state file or in pending journals (e.g. written
+    by another downloader process) are merged into the given sets before
+    writing. This process's journal, and those of processes that have
+    exited (e.g. crashed batches), are then removed.
+    
     Parameters
     ----------
     downloaded_urls : Set[str]
@@ -308,17 +632,82 @@ def save_download_state(downloaded_urls: Set[str], downloaded_files: Set[str],
         Path to state file
     """
     try:
-        data = {
-            'downloaded_urls': list(downloaded_urls),
-            'downloaded_files': list(downloaded_files),
-            'last_updated': datetime.now().isoformat()
-        }
-        with open(state_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with _state_file_lock(state_file):
+            # Merge with the state on disk so concurrent downloader processes
+            # sharing one state file don't drop each other's entries
+            on_disk = load_download_state(state_file)
+            downloaded_urls.update(on_disk['downloaded_urls'])
+            downloaded_files.update(on_disk['downloaded_files'])
+            
+            data = {
+                'downloaded_urls': list(downloaded_urls),
+                'downloaded_files': list(downloaded_files),
+                'last_updated': datetime.now().isoformat()
+            }
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_file = f"{state_file}.{os.getpid()}.tmp"
+            _save_json_file(data, tmp_file)
+            os.replace(tmp_file, state_file)
+            
+            # Everything in this process's journal is now in the state file
+            journal = _state_journal_path(state_file)
+            if os.path.exists(journal):
+                os.remove(journal)
+            # So is everything in journals whose writers have exited
+            _remove_stale_journals(state_file)
     except Exception as e:
         logger.error(f"Could not save state file: {e}", exc_info=True)
 
 
+def page_cache_path(state_file: str) -> str:
+    """Path of the scraped-page cache kept alongside a download state file."""
+    return f"{os.path.splitext(state_file)[0]}_pages.json"
+
+
+def load_page_cache(cache_file: str) -> dict:
+    """Load the cache of scraped financial pages.
+    
+    Parameters
+    ----------
+    cache_file : str
+        Path to page cache file
+    
+    Returns
+    -------
+    dict
+        Maps page URL to its 'etag', 'last_modified' and document 'links'
+    """
+    if os.path.exists(cache_file):
+        try:
+            return _load_json_file(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not load page cache: {e}")
+    return {}
+
+
+def save_page_cache(page_cache: dict, cache_file: str) -> None:
+    """Save the cache of scraped financial pages.
+    
+    Entries written meanwhile by other downloader processes are kept.
+    
+    Parameters
+    ----------
+    page_cache : dict
+        Page cache as returned by load_page_cache
+    cache_file : str
+        Path to page cache file
+    """
+    try:
+        with _state_file_lock(cache_file):
+            merged = load_page_cache(cache_file)
+            merged.update(page_cache)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            _save_json_file(merged, tmp_file)
+            os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.error(f"Could not save page cache: {e}", exc_info=True)
+
+
 def setup_logging(verbose: bool = False, log_dir: str = "logs") -> logging.Logger:
     """Configure logging with file and console handlers.
     
@@ -346,7 +735,8 @@ def setup_logging(verbose: bool = False, log_dir: str = "logs") -> logging.Logge
     logger.setLevel(logging.DEBUG)
     logger.handlers.clear()
     
-    # File handler (always DEBUG)
+    # File handler (always DEBUG: run_coordinator reads the
+    # "Direct download source:" debug lines to recover source URLs)
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(
@@ -368,6 +758,35 @@ def setup_logging(verbose: bool = False, log_dir: str = "logs") -> logging.Logge
     return logger
 
 
+def _iter_csv_columns(csv_file, columns: List[Tuple[str, str]]) -> Iterator[Tuple[str, ...]]:
+    """Yield selected columns of each CSV row, stripped.
+    
+    Reads rows as plain lists and picks fields by header position, which
+    avoids building a dict per row as csv.DictReader does.
+    
+    Parameters
+    ----------
+    csv_file : file object
+        Open CSV file whose first row is the header
+    columns : List[Tuple[str, str]]
+        (column name, default) pairs; the default is used when the column
+        is missing from the header or the row is short
+    
+    Yields
+    ------
+    Tuple[str, ...]
+        Values in the order of ``columns``
+    """
+    reader = csv.reader(csv_file)
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+    wanted = [(index.get(name), default) for name, default in columns]
+    for row in reader:
+        width = len(row)
+        yield tuple(row[i].strip() if i is not None and i < width else default
+                    for i, default in wanted)
+
+
 def load_csv_documents(csv_path: str) -> List[FinancialDocument]:
     """Load documents from university financials CSV.
     
@@ -384,19 +803,18 @@ def load_csv_documents(csv_path: str) -> List[FinancialDocument]:
     documents = []
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                doc = FinancialDocument(
-                    university=row.get('University', '').strip(),
-                    country=row.get('Country', '').strip(),
-                    domain=row.get('Domain', '').strip(),
-                    year=row.get('Year', 'N/A').strip(),
-                    url=row.get('URL', '').strip(),
-                    source='csv'
-                )
-                if doc.url:
-                    documents.append(doc)
+        columns = [('University', ''), ('Country', ''), ('Domain', ''), ('Year', 'N/A'), ('URL', '')]
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            for university, country, domain, year, url in _iter_csv_columns(f, columns):
+                if url:
+                    documents.append(FinancialDocument(
+                        university=university,
+                        country=country,
+                        domain=domain,
+                        year=year,
+                        url=url,
+                        source='csv'
+                    ))
         
         logger.info(f"{Fore.GREEN}Loaded {len(documents)} documents from {csv_path}{Style.RESET_ALL}")
         return documents
@@ -422,28 +840,25 @@ def load_gemini_documents(csv_path: str) -> List[FinancialDocument]:
     documents = []
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                uni_name = row.get('University Name', '').strip()
-                
+        columns = [('University Name', ''), ('Root Domain', ''),
+                   ('Financial Data Page', ''), ('Example Direct PDF Link', '')]
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            for uni_name, domain, data_page, pdf_link in _iter_csv_columns(f, columns):
                 # Add the financial data page
-                data_page = row.get('Financial Data Page', '').strip()
                 if data_page:
                     documents.append(FinancialDocument(
                         university=uni_name,
                         url=data_page,
-                        domain=row.get('Root Domain', '').strip(),
+                        domain=domain,
                         source='gemini_page'
                     ))
                 
                 # Add the example PDF link
-                pdf_link = row.get('Example Direct PDF Link', '').strip()
                 if pdf_link:
                     documents.append(FinancialDocument(
                         university=uni_name,
                         url=pdf_link,
-                        domain=row.get('Root Domain', '').strip(),
+                        domain=domain,
                         source='gemini_pdf'
                     ))
         
@@ -455,6 +870,63 @@ def load_gemini_documents(csv_path: str) -> List[FinancialDocument]:
         return []
 
 
+def load_search_queries(queries_path: str) -> List[str]:
+    """Load search queries from a JSONL file.
+    
+    Each line is a JSON object with a ``query`` key (other keys such as
+    ``university`` and ``year`` are informational) or a bare JSON string.
+    
+    Parameters
+    ----------
+    queries_path : str
+        Path to JSONL file
+    
+    Returns
+    -------
+    List[str]
+        Search queries in file order
+    """
+    queries = []
+    
+    with open(queries_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            query = entry.get('query', '') if isinstance(entry, dict) else str(entry)
+            if query:
+                queries.append(query)
+    
+    logger.info(f"{Fore.GREEN}Loaded {len(queries)} search queries from {queries_path}{Style.RESET_ALL}")
+    return queries
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings compare equal.
+    
+    Strips surrounding whitespace and the fragment, lowercases the scheme
+    and host and drops default ports. The query string is kept, since
+    document URLs such as ``download.aspx?id=123`` are told apart by it.
+    
+    Parameters
+    ----------
+    url : str
+        URL to normalize
+    
+    Returns
+    -------
+    str
+        Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(':')[2]) in (('http', '80'), ('https', '443')):
+        netloc = netloc.rpartition(':')[0]
+    return urlunsplit((scheme, netloc, parts.path, parts.query, ''))
+
+
 def create_session() -> Optional[requests.Session]:
     """Create a requests session with retry logic.
     
@@ -469,14 +941,26 @@ def create_session() -> Optional[requests.Session]:
     session = requests.Session()
     
     # Configure retry strategy
+    # Retries honour Retry-After on 429/503. Once they are used up the
+    # last response is returned (raise_for_status then fails it) rather
+    # than a RetryError, so HostThrottle.observe can back off that host
     retry_strategy = Retry(
         total=3,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS"]
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        raise_on_status=False
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # The download pool spreads DOWNLOAD_THREADS workers over many hosts:
+    # keep a pool for each of many recent hosts (the default is 10, so
+    # pools were being evicted and their keep-alive connections lost) and
+    # let any one pool hold a connection per worker
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=DOWNLOAD_THREADS,
+        max_retries=retry_strategy
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
@@ -485,7 +969,7 @@ def create_session() -> Optional[requests.Session]:
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-GB,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
+        'Accept-Encoding': ACCEPT_ENCODING,
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1'
     })
@@ -493,6 +977,85 @@ def create_session() -> Optional[requests.Session]:
     return session
 
 
+def _partial_path(output_dir: str, doc: FinancialDocument) -> str:
+    """Path of the .part file for a document.
+    
+    Safe filenames collide between URLs, so the name includes a hash of
+    the URL (and is taken before any content-type extension is added, so
+    it is stable across runs).
+    """
+    url_hash = hashlib.md5(doc.url.encode(), usedforsecurity=False).hexdigest()[:12]
+    return os.path.join(output_dir, f"{doc.get_safe_filename()}.{url_hash}.part")
+
+
+def _resume_validator(response: "requests.Response") -> Optional[str]:
+    """If-Range validator for a response: a strong ETag, else Last-Modified."""
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+def _discard_partial(part_path: str) -> None:
+    """Remove a partial download and its stored validator."""
+    for path in (part_path, f"{part_path}.validator"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _open_download(session: requests.Session, url: str, part_path: str) -> Tuple["requests.Response", bool]:
+    """Start a streamed GET, resuming from a partial file if one exists.
+    
+    Returns the response and whether it continues the partial file. A
+    partial file is only resumed with If-Range on the validator stored
+    when it was started, and only a 206 for the requested range with a
+    matching validator is accepted. Otherwise the partial file is
+    discarded and the full document is fetched.
+    """
+    # Ask for the bytes as stored, so a partial file can be resumed by
+    # byte offset (documents are already compressed formats anyway)
+    headers = {'Accept-Encoding': 'identity'}
+    resume_from = 0
+    validator = None
+    if os.path.exists(part_path):
+        try:
+            with open(f"{part_path}.validator", 'r', encoding='utf-8') as f:
+                validator = f.read().strip()
+        except OSError:
+            validator = None
+        if validator:
+            resume_from = os.path.getsize(part_path)
+        else:
+            # Nothing to prove the server still has the same document
+            _discard_partial(part_path)
+    if resume_from:
+        headers['Range'] = f"bytes={resume_from}-"
+        headers['If-Range'] = validator
+    
+    response = session.get(url, timeout=30, stream=True, allow_redirects=True, headers=headers)
+    if not resume_from:
+        return response, False
+    
+    if (response.status_code == 206
+            and response.headers.get('Content-Range', '').startswith(f"bytes {resume_from}-")
+            and _resume_validator(response) in (None, validator)):
+        logger.debug(f"Resuming {url} from byte {resume_from}")
+        return response, True
+    
+    if response.status_code in (206, 416):
+        # Unusable range response: start over without the partial file
+        response.close()
+        _discard_partial(part_path)
+        del headers['Range'], headers['If-Range']
+        return session.get(url, timeout=30, stream=True, allow_redirects=True, headers=headers), False
+    
+    # Range ignored or document changed (e.g. 200): the full body follows
+    # and replaces the partial file
+    return response, False
+
+
 def download_with_requests(doc: FinancialDocument, output_dir: str, session: requests.Session) -> Tuple[bool, str]:
     """Attempt to download document using requests library.
     
@@ -513,8 +1076,13 @@ def download_with_requests(doc: FinancialDocument, output_dir: str, session: req
     try:
         logger.debug(f"Attempting direct download: {doc.url}")
         
+        # Data is streamed to a .part file and renamed once complete; an
+        # interrupted download is resumed from it next time
+        part_path = _partial_path(output_dir, doc)
+        validator_path = f"{part_path}.validator"
+        
         # Try to get the file
-        response = session.get(doc.url, timeout=30, stream=True, allow_redirects=True)
+        response, resuming = _open_download(session, doc.url, part_path)
         response.raise_for_status()
         
         # Check content type
@@ -527,25 +1095,46 @@ def download_with_requests(doc: FinancialDocument, output_dir: str, session: req
             if not doc.filename.endswith('.docx'):
                 doc.filename = f"{doc.filename}.docx"
         
+        # decode_content undoes any gzip/deflate transfer encoding
+        response.raw.decode_content = True
+        
+        # Check the first bytes before writing anything: a PDF URL that
+        # serves a login page or soft 404 is abandoned straight away
+        # (leaving it to the Playwright fallback) instead of being saved.
+        # A resumed download was checked when its first bytes arrived.
+        head = b''
+        if not resuming:
+            head = response.raw.read(PDF_SNIFF_BYTES)
+            if doc.filename.lower().endswith('.pdf') and b'%PDF-' not in head:
+                response.close()
+                logger.debug(f"Not a PDF (Content-Type: {content_type or 'none'}): {doc.url}")
+                return False, f"Response is not a PDF (Content-Type: {content_type or 'none'})"
+        
         # Create output path
         safe_filename = doc.get_safe_filename()
         output_path = os.path.join(output_dir, safe_filename)
         
-        # Log what we're saving
+        # Log what we're saving; the source line names both URL and file since
+        # concurrent downloads interleave their log lines
+        logger.debug(f"Direct download source: {doc.url} -> {safe_filename}")
         logger.info(f"{Fore.YELLOW}  → Saving as: {safe_filename}{Style.RESET_ALL}")
         
-        # Download file
-        total_size = int(response.headers.get('content-length', 0))
+        # A fresh partial file records the validator it can be resumed against
+        if not resuming:
+            validator = _resume_validator(response)
+            if validator:
+                with open(validator_path, 'w', encoding='utf-8') as f:
+                    f.write(validator)
+            elif os.path.exists(validator_path):
+                os.remove(validator_path)
         
-        with open(output_path, 'wb') as f:
-            if total_size == 0:
-                f.write(response.content)
-            else:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
+        # Download file, copying the stream in C rather than a Python chunk loop
+        with response, open(part_path, 'ab' if resuming else 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            f.write(head)
+            shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+        os.replace(part_path, output_path)
+        if os.path.exists(validator_path):
+            os.remove(validator_path)
         
         file_size = os.path.getsize(output_path)
         logger.debug(f"Downloaded {file_size} bytes to {output_path}")
@@ -560,9 +1149,38 @@ def download_with_requests(doc: FinancialDocument, output_dir: str, session: req
         return False, str(e)
 
 
-def scrape_financial_page(url: str, domain: str, session: requests.Session) -> List[str]:
+def extract_links(content: bytes) -> List[Tuple[str, str]]:
+    """Extract all links from an HTML page.
+    
+    Uses selectolax when available, otherwise BeautifulSoup.
+    
+    Parameters
+    ----------
+    content : bytes
+        Raw HTML (passed undecoded so the parser handles the encoding)
+    
+    Returns
+    -------
+    List[Tuple[str, str]]
+        (href, link text) for every <a> element with an href
+    """
+    if _HAVE_SELECTOLAX:
+        tree = LexborHTMLParser(content)
+        return [(node.attributes.get('href') or '', node.text())
+                for node in tree.css('a[href]')]
+    
+    soup = BeautifulSoup(content, _BS4_PARSER)
+    return [(link['href'], link.get_text()) for link in soup.find_all('a', href=True)]
+
+
+def scrape_financial_page(url: str, domain: str, session: requests.Session,
+                          page_cache: Optional[dict] = None) -> List[str]:
     """Scrape a financial data page to find all document links.
     
+    With a page cache, the page is requested conditionally using the ETag
+    and Last-Modified of the previous scrape; if the server answers 304 Not
+    Modified the cached links are returned without refetching or parsing.
+    
     Parameters
     ----------
     url : str
@@ -571,42 +1189,87 @@ def scrape_financial_page(url: str, domain: str, session: requests.Session) -> L
         University domain to validate links
     session : requests.Session
         Requests session
+    page_cache : Optional[dict]
+        Cache from load_page_cache, updated in place
     
     Returns
     -------
     List[str]
         List of document URLs found
     """
-    if not _HAVE_BS4:
-        logger.warning("BeautifulSoup not available, skipping page scraping")
+    if not (_HAVE_SELECTOLAX or _HAVE_BS4):
+        logger.warning("No HTML parser available, skipping page scraping")
         return []
     
     try:
         logger.debug(f"Scraping financial page: {url}")
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
+        cached = page_cache.get(url) if page_cache is not None else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Streamed, so bodies that are not pages (or are huge) are never
+        # pulled into memory whole
+        with session.get(url, timeout=30, headers=headers, stream=True) as response:
+            if response.status_code == 304 and cached:
+                logger.debug(f"Page not modified, using {len(cached['links'])} cached links")
+                return list(cached['links'])
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and 'html' not in content_type and 'xml' not in content_type:
+                logger.debug(f"Not an HTML page ({content_type}), skipping: {url}")
+                return []
+            
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=SCRAPE_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_SCRAPE_PAGE_BYTES:
+                    logger.debug(f"Page larger than {MAX_SCRAPE_PAGE_BYTES} bytes, parsing the start only: {url}")
+                    break
+            content = b''.join(chunks)
         
         # Find all links
-        links = soup.find_all('a', href=True)
+        links = extract_links(content)
         
         document_urls = []
         seen_urls = set()
         
-        for link in links:
-            href = link['href']
-            
-            # Convert relative URLs to absolute
-            absolute_url = urljoin(url, href)
+        base = urlsplit(url)
+        origin = f"{base.scheme}://{base.netloc}"
+        
+        for href, link_text in links:
+            # Convert relative URLs to absolute. Root-relative links (most
+            # intra-site links) just need the origin; anything that could
+            # involve scheme-relative or dot-segment resolution uses urljoin
+            if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+                absolute_url = canonical_url(origin + href)
+            else:
+                absolute_url = canonical_url(urljoin(url, href))
             
             # Check if it's a document link
-            if is_financial_document(absolute_url, link.get_text()):
+            if is_financial_document(absolute_url, link_text):
                 if absolute_url not in seen_urls:
                     seen_urls.add(absolute_url)
                     document_urls.append(absolute_url)
         
         logger.debug(f"Found {len(document_urls)} document links on page")
+        
+        # Only pages the server can validate are worth caching
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if page_cache is not None and (etag or last_modified):
+            page_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'links': document_urls
+            }
+        
         return document_urls
     
     except Exception as e:
@@ -629,62 +1292,125 @@ def is_financial_document(url: str, link_text: str = "") -> bool:
     bool
         True if appears to be an official university annual report
     """
-    # File extensions to look for
-    doc_extensions = ['.pdf', '.docx', '.doc', '.xlsx', '.xls']
-    
     url_lower = url.lower()
-    text_lower = link_text.lower()
-    combined_text = f"{url_lower} {text_lower}"
-    
-    # Check if URL has document extension
-    has_extension = any(url_lower.endswith(ext) for ext in doc_extensions)
-    
-    # Strong indicators of official annual reports - require at least one
-    official_indicators = [
-        'annual-report-and-accounts', 'annual_report_and_accounts',
-        'annual-report-accounts', 'annual_report_accounts',
-        'financial-statements', 'financial_statements',
-        'report-and-accounts', 'report_and_accounts',
-        'annual-accounts', 'annual_accounts',
-        '/governance/', '/about/reports/', '/finance/',
-        '/corporate/', '/publications/annual',
-    ]
-    
-    has_official_indicator = any(ind in combined_text for ind in official_indicators)
-    
-    # Weaker financial keywords - only use if combined with other signals
-    financial_keywords = [
-        'annual report', 'financial statement', 'accounts',
-        'statutory accounts', 'consolidated accounts'
-    ]
-    
-    has_financial_keyword = any(kw in combined_text for kw in financial_keywords)
-    
-    # EXCLUDE patterns - academic/research content that is NOT official reports
-    exclude_patterns = [
-        # Academic repositories and research
-        'repository', 'eprint', 'dspace', 'handle.net', 'research.',
-        '/research/', 'publications/research', 'pure.', 'openaccess',
-        # Student/thesis content
-        'thesis', 'dissertation', 'student', 'coursework', 'assignment',
-        'essay', '/students/', 'module', 'degree',
-        # Economics/academic papers
-        'working-paper', 'working_paper', 'discussion-paper',
-        'economics', 'economist', 'faculty', 'journal', 'article',
-        # Administrative/other
-        'course', 'prospectus', 'login', 'portal', 'admissions',
-        'apply', 'news', 'blog', 'press-release', 'event',
-        # File patterns for non-reports
-        'cv.pdf', 'resume', 'syllabus', 'handbook', 'guide',
-    ]
-    
-    has_exclude = any(pattern in combined_text for pattern in exclude_patterns)
-    
-    # Must have extension, must have official indicator OR financial keyword, must not have excludes
-    return has_extension and (has_official_indicator or has_financial_keyword) and not has_exclude
-
-
-def download_with_playwright(doc: FinancialDocument, output_dir: str, headless: bool = True) -> Tuple[bool, str]:
+    
+    # Check if the URL has a document extension, ignoring any query string
+    # or fragment (e.g. report.pdf?v=2)
+    if not url_lower.split('#', 1)[0].split('?', 1)[0].endswith(_DOC_EXTENSIONS):
+        return False
+    
+    combined_text = f"{url_lower} {link_text.lower()}"
+    
+    has_official_indicator = _OFFICIAL_INDICATOR_RE.search(combined_text) is not None
+    has_financial_keyword = _FINANCIAL_KEYWORD_RE.search(combined_text) is not None
+    has_exclude = _EXCLUDE_RE.search(combined_text) is not None
+    
+    # Must have official indicator OR financial keyword, must not have excludes
+    return (has_official_indicator or has_financial_keyword) and not has_exclude
+
+
+class PlaywrightBrowsers:
+    """Playwright browsers shared by all fallback downloads in a run.
+    
+    Launching Chromium takes seconds, so instead of one browser per
+    document a single browser context per headless mode is started on
+    first use and kept open; each download only opens a new page.
+    Chromium's memory grows with every navigation, so a browser is
+    relaunched once it has served ``max_pages`` pages or is older than
+    ``max_age`` seconds. A visible browser is only recycled with a
+    persistent profile, since otherwise relaunching it would drop the
+    cookies from CAPTCHAs and cookie walls the user got past by hand.
+    Playwright's sync API is bound to the thread that started it, so an
+    instance must only be used from one thread.
+    
+    With ``user_data_dir`` the context is a persistent Chromium profile, so
+    cookies and logins completed once (e.g. in a --visible-browser run)
+    are reused by later runs. Chromium locks a profile to one browser, so
+    only one headless mode is kept open at a time in that case.
+    """
+    
+    def __init__(self, max_pages: int = 50, max_age: float = 300.0,
+                 user_data_dir: Optional[str] = None) -> None:
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.user_data_dir = user_data_dir
+        self._playwright = None
+        self._browsers = {}
+        self._contexts = {}
+        self._pages_served = {}
+        self._launched_at = {}
+    
+    def get_context(self, headless: bool = True):
+        """Return the shared browser context for one new page.
+        
+        Launches the browser if needed, or relaunches it if it has reached
+        its page or age limit (visible browsers only with ``user_data_dir``).
+        
+        Parameters
+        ----------
+        headless : bool
+            Whether the browser runs in headless mode
+        
+        Returns
+        -------
+        BrowserContext
+            Context with downloads enabled
+        """
+        recyclable = headless or bool(self.user_data_dir)
+        if recyclable and headless in self._contexts and (
+                self._pages_served[headless] >= self.max_pages
+                or time.monotonic() - self._launched_at[headless] >= self.max_age):
+            logger.debug(f"Recycling browser (headless={headless}) after "
+                         f"{self._pages_served[headless]} pages")
+            self._close_browser(headless)
+        
+        if headless not in self._contexts:
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            context_options = {
+                'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'accept_downloads': True
+            }
+            if self.user_data_dir:
+                # The profile can only be open in one browser at a time
+                for other in list(self._browsers):
+                    self._close_browser(other)
+                context = self._playwright.chromium.launch_persistent_context(
+                    self.user_data_dir, headless=headless, **context_options
+                )
+                # A persistent context is closed directly; there is no Browser
+                self._browsers[headless] = context
+                self._contexts[headless] = context
+            else:
+                browser = self._playwright.chromium.launch(headless=headless)
+                self._browsers[headless] = browser
+                self._contexts[headless] = browser.new_context(**context_options)
+            self._pages_served[headless] = 0
+            self._launched_at[headless] = time.monotonic()
+        
+        self._pages_served[headless] += 1
+        return self._contexts[headless]
+    
+    def _close_browser(self, headless: bool) -> None:
+        """Close the browser for one headless mode."""
+        browser = self._browsers.pop(headless)
+        self._contexts.pop(headless)
+        try:
+            browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+    
+    def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        for headless in list(self._browsers):
+            self._close_browser(headless)
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+def download_with_playwright(doc: FinancialDocument, output_dir: str, headless: bool = True,
+                             browsers: Optional[PlaywrightBrowsers] = None) -> Tuple[bool, str]:
     """Download document using Playwright browser automation.
     
     Parameters
@@ -695,6 +1421,9 @@ def download_with_playwright(doc: FinancialDocument, output_dir: str, headless:
         Output directory
     headless : bool
         Whether to run in headless mode
+    browsers : Optional[PlaywrightBrowsers]
+        Shared browsers to open the page in (a temporary browser is
+        launched and closed if None)
     
     Returns
     -------
@@ -704,78 +1433,83 @@ def download_with_playwright(doc: FinancialDocument, output_dir: str, headless:
     if not _HAVE_PLAYWRIGHT:
         return False, "Playwright not installed"
     
+    own_browsers = browsers is None
+    if own_browsers:
+        browsers = PlaywrightBrowsers()
+    
+    page = None
     try:
         logger.debug(f"Attempting Playwright download (headless={headless}): {doc.url}")
         
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=headless)
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                accept_downloads=True
-            )
-            page = context.new_page()
-            
-            # Set up download handler
-            download_info = {'path': None}
-            
-            def handle_download(download):
-                safe_filename = doc.get_safe_filename()
-                output_path = os.path.join(output_dir, safe_filename)
-                download.save_as(output_path)
-                download_info['path'] = output_path
-            
-            page.on('download', handle_download)
-            
-            # Navigate to URL
+        page = browsers.get_context(headless).new_page()
+        
+        # Set up download handler
+        download_info = {'path': None}
+        
+        def handle_download(download):
+            safe_filename = doc.get_safe_filename()
+            output_path = os.path.join(output_dir, safe_filename)
+            download.save_as(output_path)
+            download_info['path'] = output_path
+        
+        page.on('download', handle_download)
+        
+        # Navigate to URL
+        try:
+            page.goto(doc.url, wait_until='networkidle', timeout=60000)
+        except PlaywrightTimeout:
+            logger.debug("Page load timeout, proceeding anyway")
+        
+        # Check if it's a direct file download
+        if doc.file_type in ['pdf', 'docx', 'xlsx']:
+            # Wait a bit for download to trigger
+            time.sleep(2)
+        
+        # If no download triggered, try to find and click download link
+        if not download_info['path']:
             try:
-                page.goto(doc.url, wait_until='networkidle', timeout=60000)
-            except PlaywrightTimeout:
-                logger.debug("Page load timeout, proceeding anyway")
-            
-            # Check if it's a direct file download
-            if doc.file_type in ['pdf', 'docx', 'xlsx']:
-                # Wait a bit for download to trigger
-                time.sleep(2)
-            
-            # If no download triggered, try to find and click download link
-            if not download_info['path']:
-                try:
-                    # Look for download buttons/links
-                    download_selectors = [
-                        'a[download]',
-                        'button:has-text("Download")',
-                        'a:has-text("Download")',
-                        'a:has-text("PDF")',
-                    ]
-                    
-                    for selector in download_selectors:
-                        try:
-                            element = page.locator(selector).first
-                            if element.is_visible():
-                                element.click()
-                                time.sleep(2)
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    logger.debug(f"No download button found: {e}")
-            
-            browser.close()
-            
-            if download_info['path']:
-                logger.debug(f"Playwright download successful: {download_info['path']}")
-                return True, download_info['path']
-            else:
-                return False, "No download triggered"
+                # Look for download buttons/links
+                download_selectors = [
+                    'a[download]',
+                    'button:has-text("Download")',
+                    'a:has-text("Download")',
+                    'a:has-text("PDF")',
+                ]
+                
+                for selector in download_selectors:
+                    try:
+                        element = page.locator(selector).first
+                        if element.is_visible():
+                            element.click()
+                            time.sleep(2)
+                            break
+                    except:
+                        continue
+            except Exception as e:
+                logger.debug(f"No download button found: {e}")
+        
+        if download_info['path']:
+            logger.debug(f"Playwright download successful: {download_info['path']}")
+            return True, download_info['path']
+        else:
+            return False, "No download triggered"
     
     except Exception as e:
         logger.debug(f"Playwright download failed: {e}")
         return False, str(e)
+    finally:
+        if page is not None:
+            try:
+                page.close()
+            except Exception:
+                pass
+        if own_browsers:
+            browsers.close()
 
 
 def download_document(doc: FinancialDocument, output_dir: str, session: requests.Session, 
-                     use_playwright: bool = True, headless: bool = True) -> Tuple[bool, str, str]:
+                     use_playwright: bool = True, headless: bool = True,
+                     browsers: Optional[PlaywrightBrowsers] = None) -> Tuple[bool, str, str]:
     """Download a financial document using multiple strategies.
     
     Parameters
@@ -790,6 +1524,8 @@ def download_document(doc: FinancialDocument, output_dir: str, session: requests
         Whether to try Playwright if requests fails
     headless : bool
         Whether to run Playwright in headless mode
+    browsers : Optional[PlaywrightBrowsers]
+        Shared Playwright browsers for the fallback strategies
     
     Returns
     -------
@@ -805,14 +1541,14 @@ def download_document(doc: FinancialDocument, output_dir: str, session: requests
     
     # Strategy 2: Try Playwright headless
     if use_playwright and _HAVE_PLAYWRIGHT and headless:
-        success, result = download_with_playwright(doc, output_dir, headless=True)
+        success, result = download_with_playwright(doc, output_dir, headless=True, browsers=browsers)
         if success:
             return True, result, "playwright_headless"
         logger.debug(f"Playwright headless failed: {result}")
     
     # Strategy 3: Try Playwright with visible browser (manual intervention possible)
     if use_playwright and _HAVE_PLAYWRIGHT and not headless:
-        success, result = download_with_playwright(doc, output_dir, headless=False)
+        success, result = download_with_playwright(doc, output_dir, headless=False, browsers=browsers)
         if success:
             return True, result, "playwright_visible"
         logger.debug(f"Playwright visible failed: {result}")
@@ -820,12 +1556,140 @@ def download_document(doc: FinancialDocument, output_dir: str, session: requests
     return False, "All download methods failed", "none"
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After style header value.
+    
+    Accepts delta-seconds, a Unix timestamp (as some X-RateLimit-Reset
+    headers use) or an HTTP date; returns None if missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+    if seconds > 1e9:
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+class HostThrottle:
+    """Per-host limits for concurrent downloads.
+    
+    Caps the number of simultaneous requests to each host and spaces out
+    request starts to the same host, replacing the fixed sleep that the
+    serial download loop used between documents.
+    """
+    
+    def __init__(self, max_per_host: int = 2, min_interval: float = 0.5,
+                 default_backoff: float = 30.0, max_backoff: float = 300.0) -> None:
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+    
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold off new requests to the URL's host for the given time."""
+        host = urlparse(url).netloc.lower()
+        seconds = min(seconds, self.max_backoff)
+        logger.debug(f"Backing off {host} for {seconds:.0f}s")
+        with self._lock:
+            self._next_start[host] = max(self._next_start.get(host, 0.0),
+                                         time.monotonic() + seconds)
+    
+    def observe(self, response: "requests.Response", *args, **kwargs) -> None:
+        """Response hook: back off hosts that signal rate limiting.
+        
+        Reacts to 429/503 responses (using Retry-After when given) and to
+        an exhausted X-RateLimit-Remaining quota (using X-RateLimit-Reset).
+        """
+        headers = response.headers
+        if response.status_code in (429, 503):
+            delay = _parse_retry_after(headers.get('Retry-After'))
+            self.defer(response.url, self.default_backoff if delay is None else delay)
+        elif headers.get('X-RateLimit-Remaining', '').strip() == '0':
+            delay = _parse_retry_after(headers.get('X-RateLimit-Reset'))
+            self.defer(response.url, self.default_backoff if delay is None else delay)
+    
+    @contextmanager
+    def slot(self, url: str):
+        """Hold a request slot for the URL's host for the duration of the block."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.Semaphore(self.max_per_host)
+        
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, 0.0))
+                self._next_start[host] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def _interleave_by_host(jobs: List[FinancialDocument]) -> List[FinancialDocument]:
+    """Order jobs round-robin across hosts, keeping each host's own order.
+    
+    Consecutive jobs then go to different hosts, so the worker pool is not
+    queued up behind HostThrottle's per-host limit while other hosts sit
+    idle. Each host keeps its own pooled keep-alive connections (see
+    create_session), so spreading its jobs out costs no extra handshakes.
+    """
+    by_host = {}
+    for job in jobs:
+        by_host.setdefault(urlparse(job.url).netloc, []).append(job)
+    
+    queues = [iter(host_jobs) for host_jobs in by_host.values()]
+    ordered = []
+    while queues:
+        remaining = []
+        for queue in queues:
+            job = next(queue, None)
+            if job is not None:
+                ordered.append(job)
+                remaining.append(queue)
+        queues = remaining
+    return ordered
+
+
+def _download_job(doc: FinancialDocument, output_dir: str, session: requests.Session,
+                  throttle: HostThrottle, name_lock: threading.Lock) -> Tuple[bool, str]:
+    """Worker for process_documents: throttled direct download of one document.
+    
+    ``name_lock`` serializes documents that would be saved under the same
+    filename, so concurrent downloads never write the same file.
+    """
+    try:
+        with name_lock, throttle.slot(doc.url):
+            return download_with_requests(doc, output_dir, session)
+    except Exception as e:
+        return False, str(e)
+
+
 def process_documents(documents: List[FinancialDocument], output_dir: str, 
                      scrape_pages: bool = True, max_docs: Optional[int] = None,
                      use_playwright: bool = True, visible_browser: bool = False,
-                     state_file: str = "download_state.json") -> dict:
+                     state_file: str = "download_state.json",
+                     max_workers: int = DOWNLOAD_THREADS,
+                     browser_profile: Optional[str] = None) -> dict:
     """Process and download all documents.
     
+    Financial pages are scraped first to collect the documents to fetch.
+    Direct downloads then run concurrently on a thread pool sharing the
+    requests session (throttled per host), and documents that fail are
+    retried serially with Playwright, whose sync API is single-threaded.
+    
     Parameters
     ----------
     documents : List[FinancialDocument]
@@ -842,6 +1706,10 @@ def process_documents(documents: List[FinancialDocument], output_dir: str,
         Whether to use visible browser (for manual intervention)
     state_file : str
         Path to state file for tracking downloads
+    max_workers : int
+        Number of concurrent direct downloads
+    browser_profile : Optional[str]
+        Persistent Playwright profile directory (see PlaywrightBrowsers)
     
     Returns
     -------
@@ -856,7 +1724,7 @@ def process_documents(documents: List[FinancialDocument], output_dir: str,
     
     # Load previous download state
     state = load_download_state(state_file)
-    downloaded_urls = state['downloaded_urls']
+    downloaded_urls = {canonical_url(url) for url in state['downloaded_urls']}
     downloaded_files = state['downloaded_files']
     
     # Count previously downloaded
@@ -880,13 +1748,44 @@ def process_documents(documents: List[FinancialDocument], output_dir: str,
         }
     }
     
+    # Canonicalize and deduplicate URLs up front (the same document often
+    # appears in several CSV rows or sources)
+    unique_documents = []
+    seen_urls = set()
+    for doc in documents:
+        doc.url = canonical_url(doc.url)
+        if doc.url not in seen_urls:
+            seen_urls.add(doc.url)
+            unique_documents.append(doc)
+    if len(unique_documents) < len(documents):
+        logger.info(f"{Fore.CYAN}Removed {len(documents) - len(unique_documents)} duplicate URLs{Style.RESET_ALL}")
+    documents = unique_documents
+    stats['total'] = len(documents)
+    
     # Limit documents if specified
     if max_docs:
         documents = documents[:max_docs]
         stats['total'] = len(documents)
     
-    # Progress bar
-    doc_iterator = tqdm(documents, desc="Downloading documents", unit="doc") if _HAVE_TQDM else documents
+    def record_success(doc: FinancialDocument, result: str, method: str) -> None:
+        logger.info(f"{Fore.GREEN}✓ Downloaded via {method}: {result}{Style.RESET_ALL}")
+        stats['successful'] += 1
+        stats['methods'][method] += 1
+        downloaded_urls.add(doc.url)
+        downloaded_files.add(result)
+        # Journal each download; rewrite the full state file only periodically
+        append_download_state(doc.url, result, state_file)
+        if stats['successful'] % STATE_CHECKPOINT_INTERVAL == 0:
+            save_download_state(downloaded_urls, downloaded_files, state_file)
+    
+    # Collect the documents to download, scraping financial pages for links
+    page_cache_file = page_cache_path(state_file)
+    page_cache = load_page_cache(page_cache_file) if scrape_pages else {}
+    pages_scraped = 0
+    jobs = []
+    queued_urls = set()
+    interrupted = False
+    doc_iterator = tqdm(documents, desc="Collecting documents", unit="doc") if _HAVE_TQDM else documents
     
     for doc in doc_iterator:
         try:
@@ -901,10 +1800,14 @@ def process_documents(documents: List[FinancialDocument], output_dir: str,
             # Extract filename and title info from URL
             url_filename = doc.url.split('/')[-1].split('?')[0]
             
-            logger.info(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
-            logger.info(f"{Fore.CYAN}{Style.BRIGHT}Processing: {doc.university}{Style.RESET_ALL}")
-            logger.info(f"{Fore.YELLOW}File from URL: {url_filename}{Style.RESET_ALL}")
-            logger.info(f"{Fore.WHITE}URL: {doc.url}{Style.RESET_ALL}")
+            # One record for the whole header rather than one per line; the
+            # rule starts the record so it carries the level prefix
+            logger.info(
+                f"{_RULE}\n"
+                f"{Fore.CYAN}{Style.BRIGHT}Processing: {doc.university}{Style.RESET_ALL}\n"
+                f"{Fore.YELLOW}File from URL: {url_filename}{Style.RESET_ALL}\n"
+                f"{Fore.WHITE}URL: {doc.url}{Style.RESET_ALL}"
+            )
             
             # Check if it's a page to scrape or a direct document
             is_page = doc.source.endswith('_page') or not doc.file_type or doc.file_type == 'unknown'
@@ -912,78 +1815,120 @@ def process_documents(documents: List[FinancialDocument], output_dir: str,
             if is_page and scrape_pages and session:
                 # Scrape the page for document links
                 logger.info(f"{Fore.YELLOW}Scraping financial page for documents...{Style.RESET_ALL}")
-                doc_urls = scrape_financial_page(doc.url, doc.domain or '', session)
+                doc_urls = scrape_financial_page(doc.url, doc.domain or '', session, page_cache)
+                pages_scraped += 1
                 
                 if doc_urls:
                     logger.info(f"{Fore.GREEN}Found {len(doc_urls)} documents on page{Style.RESET_ALL}")
                     stats['scraped_additional'] += len(doc_urls)
                     
-                    # Download each found document
+                    # Queue each found document
                     for doc_url in doc_urls:
-                        if doc_url in downloaded_urls:
+                        if doc_url in downloaded_urls or doc_url in queued_urls:
                             continue
-                        
-                        scraped_doc = FinancialDocument(
+                        queued_urls.add(doc_url)
+                        jobs.append(FinancialDocument(
                             university=doc.university,
                             url=doc_url,
                             domain=doc.domain,
                             country=doc.country,
                             source='scraped'
-                        )
-                        
-                        success, result, method = download_document(
-                            scraped_doc, output_dir, session, use_playwright, not visible_browser
-                        )
-                        
-                        if success:
-                            logger.info(f"{Fore.GREEN}✓ Downloaded via {method}: {result}{Style.RESET_ALL}")
-                            stats['successful'] += 1
-                            stats['methods'][method] += 1
-                            downloaded_urls.add(doc_url)
-                            downloaded_files.add(result)
-                            # Save state after each successful download
-                            save_download_state(downloaded_urls, downloaded_files, state_file)
-                        else:
-                            logger.warning(f"{Fore.YELLOW}✗ Failed: {result}{Style.RESET_ALL}")
-                            stats['failed'] += 1
-                        
-                        time.sleep(1)  # Rate limiting
+                        ))
                 else:
                     logger.warning(f"{Fore.YELLOW}No documents found on page{Style.RESET_ALL}")
-            else:
-                # Direct document download
-                success, result, method = download_document(
-                    doc, output_dir, session, use_playwright, not visible_browser
-                )
                 
-                if success:
-                    logger.info(f"{Fore.GREEN}✓ Downloaded via {method}: {result}{Style.RESET_ALL}")
-                    stats['successful'] += 1
-                    stats['methods'][method] += 1
-                    downloaded_urls.add(doc.url)
-                    downloaded_files.add(result)
-                    # Save state after each successful download
-                    save_download_state(downloaded_urls, downloaded_files, state_file)
-                else:
-                    logger.warning(f"{Fore.YELLOW}✗ Failed: {result}{Style.RESET_ALL}")
-                    stats['failed'] += 1
-            
-            # Rate limiting
-            time.sleep(0.5)
+                # Rate limiting between page scrapes
+                time.sleep(0.5)
+            elif doc.url not in queued_urls:
+                # Direct document download
+                queued_urls.add(doc.url)
+                jobs.append(doc)
         
         except KeyboardInterrupt:
             logger.warning(f"\n{Fore.YELLOW}Process interrupted by user{Style.RESET_ALL}")
+            interrupted = True
             break
         except Exception as e:
             logger.error(f"{Fore.RED}Error processing document: {e}{Style.RESET_ALL}", exc_info=True)
             stats['failed'] += 1
     
+    if pages_scraped:
+        save_page_cache(page_cache, page_cache_file)
+    
+    # Direct downloads, run concurrently; results are handled on this thread
+    fallback_jobs = []
+    if jobs and not interrupted and _HAVE_REQUESTS and session:
+        logger.info(f"{Fore.CYAN}Downloading {len(jobs)} documents with up to {max_workers} workers{Style.RESET_ALL}")
+        throttle = HostThrottle()
+        session.hooks['response'].append(throttle.observe)
+        name_locks = {}
+        progress = tqdm(total=len(jobs), desc="Downloading documents", unit="doc") if _HAVE_TQDM else None
+        
+        jobs = _interleave_by_host(jobs)
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            futures = {
+                executor.submit(_download_job, job, output_dir, session, throttle,
+                                name_locks.setdefault(job.get_safe_filename(), threading.Lock())): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                success, result = future.result()
+                if success:
+                    record_success(job, result, 'requests')
+                else:
+                    logger.debug(f"Requests method failed for {job.url}: {result}")
+                    fallback_jobs.append(job)
+                if progress is not None:
+                    progress.update(1)
+        except KeyboardInterrupt:
+            logger.warning(f"\n{Fore.YELLOW}Process interrupted by user{Style.RESET_ALL}")
+            interrupted = True
+            # Stop here as the serial loop did; don't start the browser fallback
+            fallback_jobs = []
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if progress is not None:
+                progress.close()
+    elif not interrupted:
+        fallback_jobs = jobs
+    
+    # Browser fallback for anything the direct download could not fetch
+    browsers = (PlaywrightBrowsers(user_data_dir=browser_profile)
+                if use_playwright and _HAVE_PLAYWRIGHT else None)
+    try:
+        for job in fallback_jobs:
+            try:
+                success, result, method = download_document(
+                    job, output_dir, None, use_playwright, not visible_browser, browsers
+                )
+                if success:
+                    record_success(job, result, method)
+                else:
+                    logger.warning(f"{Fore.YELLOW}✗ Failed: {job.url}: {result}{Style.RESET_ALL}")
+                    stats['failed'] += 1
+            except KeyboardInterrupt:
+                logger.warning(f"\n{Fore.YELLOW}Process interrupted by user{Style.RESET_ALL}")
+                break
+            except Exception as e:
+                logger.error(f"{Fore.RED}Error processing document: {e}{Style.RESET_ALL}", exc_info=True)
+                stats['failed'] += 1
+    finally:
+        if browsers is not None:
+            browsers.close()
+        # Fold this run's journal into the state file
+        if stats['successful']:
+            save_download_state(downloaded_urls, downloaded_files, state_file)
+    
     return stats
 
 
 def main(verbose: bool = False, max_docs: Optional[int] = None, scrape: bool = True,
          use_playwright: bool = True, visible_browser: bool = False,
-         search_query: Optional[str] = None, output_dir: Optional[str] = None) -> None:
+         search_query: Optional[str] = None, output_dir: Optional[str] = None,
+         queries_file: Optional[str] = None, concurrency: int = DOWNLOAD_THREADS,
+         browser_profile: Optional[str] = None) -> None:
     """Main function to orchestrate document downloads.
     
     Parameters
@@ -1002,6 +1947,12 @@ def main(verbose: bool = False, max_docs: Optional[int] = None, scrape: bool = T
         Custom search query for targeted document search
     output_dir : Optional[str]
         Custom output directory (default: downloads_<timestamp>)
+    queries_file : Optional[str]
+        JSONL file of search queries to run in one batch (see load_search_queries)
+    concurrency : int
+        Number of concurrent direct downloads
+    browser_profile : Optional[str]
+        Persistent Playwright profile directory, reused across runs
     """
     global logger
     
@@ -1021,16 +1972,37 @@ def main(verbose: bool = False, max_docs: Optional[int] = None, scrape: bool = T
             logger.error(f"{Fore.RED}requests library not installed. Cannot proceed.{Style.RESET_ALL}")
             sys.exit(1)
         
-        if not _HAVE_BS4:
-            logger.warning(f"{Fore.YELLOW}BeautifulSoup not installed. Page scraping disabled.{Style.RESET_ALL}")
+        if not (_HAVE_SELECTOLAX or _HAVE_BS4):
+            logger.warning(f"{Fore.YELLOW}Neither selectolax nor BeautifulSoup installed. Page scraping disabled.{Style.RESET_ALL}")
             scrape = False
         
         if not _HAVE_PLAYWRIGHT and use_playwright:
             logger.warning(f"{Fore.YELLOW}Playwright not installed. Fallback method unavailable.{Style.RESET_ALL}")
             use_playwright = False
         
+        # Handle a batch of search queries
+        if queries_file:
+            search_limit = max_docs if max_docs else 10
+            all_documents = []
+            queries = load_search_queries(queries_file)
+            if _HAVE_DDGS and queries:
+                # One client for the whole batch instead of one per query
+                with DDGS(timeout=20) as ddgs:
+                    for query in queries:
+                        print(f"{Fore.CYAN}Query: {query}{Style.RESET_ALL}")
+                        all_documents.extend(search_for_documents(query, max_results=search_limit, ddgs=ddgs))
+            else:
+                for query in queries:
+                    print(f"{Fore.CYAN}Query: {query}{Style.RESET_ALL}")
+                    all_documents.extend(search_for_documents(query, max_results=search_limit))
+            
+            if not all_documents:
+                logger.warning(f"{Fore.YELLOW}No documents found for queries in: {queries_file}{Style.RESET_ALL}")
+                return
+            # The limit applies per query, not to the combined batch
+            max_docs = None
         # Handle custom search query
-        if search_query:
+        elif search_query:
             logger.info(f"{Fore.CYAN}Using custom search query: {search_query}{Style.RESET_ALL}")
             search_limit = max_docs if max_docs else 10
             all_documents = search_for_documents(search_query, max_results=search_limit)
@@ -1043,7 +2015,13 @@ def main(verbose: bool = False, max_docs: Optional[int] = None, scrape: bool = T
             all_documents = []
             
             # Find CSV files
-            results_files = list(Path('.').glob('university_financials_results_*.csv'))
+            # scandir's cached d_type avoids a stat per directory entry
+            with os.scandir('.') as entries:
+                results_files = sorted(
+                    entry.path for entry in entries
+                    if fnmatch.fnmatch(entry.name, 'university_financials_results_*.csv')
+                    and entry.is_file()
+                )
             gemini_file = Path('gemini_list.csv')
             
             if not results_files and not gemini_file.exists():
@@ -1078,12 +2056,14 @@ def main(verbose: bool = False, max_docs: Optional[int] = None, scrape: bool = T
         logger.info(f"{Fore.CYAN}Scrape pages: {scrape}{Style.RESET_ALL}")
         logger.info(f"{Fore.CYAN}Use Playwright: {use_playwright}{Style.RESET_ALL}")
         logger.info(f"{Fore.CYAN}Visible browser: {visible_browser}{Style.RESET_ALL}")
+        logger.info(f"{Fore.CYAN}Concurrent downloads: {concurrency}{Style.RESET_ALL}")
         
         # Process documents
         stats = process_documents(
             all_documents, output_dir, scrape_pages=scrape,
             max_docs=max_docs, use_playwright=use_playwright,
-            visible_browser=visible_browser
+            visible_browser=visible_browser, max_workers=concurrency,
+            browser_profile=browser_profile
         )
         
         # Print summary
@@ -1128,6 +2108,7 @@ Examples:
   python download_financial_documents.py --no-scrape        # Skip page scraping
   python download_financial_documents.py --no-playwright    # Requests only
   python download_financial_documents.py --visible-browser  # Use visible browser
+  python download_financial_documents.py --queries-file q.jsonl --limit 5  # Batch searches
 
 Download Strategies:
   1. Direct download with requests (fastest, may be blocked)
@@ -1169,6 +2150,14 @@ The script will automatically try methods in order until one succeeds.
         help='Use visible browser (allows manual security checks)'
     )
     
+    parser.add_argument(
+        '--browser-profile',
+        type=str,
+        metavar='DIR',
+        help='Persistent browser profile for the Playwright fallback; cookies and logins '
+             'completed with --visible-browser are reused by later runs'
+    )
+    
     parser.add_argument(
         '--search',
         type=str,
@@ -1176,6 +2165,13 @@ The script will automatically try methods in order until one succeeds.
         help='Custom search query for targeted document search'
     )
     
+    parser.add_argument(
+        '--queries-file',
+        type=str,
+        metavar='FILE',
+        help='JSONL file of search queries to run in one batch ({"query": ...} per line)'
+    )
+    
     parser.add_argument(
         '--output',
         type=str,
@@ -1187,7 +2183,15 @@ The script will automatically try methods in order until one succeeds.
         '--limit',
         type=int,
         metavar='N',
-        help='Limit number of search results (used with --search)'
+        help='Limit number of search results (used with --search or --queries-file)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        metavar='N',
+        default=DOWNLOAD_THREADS,
+        help=f'Number of concurrent downloads; at most 2 run against any one host (default: {DOWNLOAD_THREADS})'
     )
     
     parser.add_argument(
@@ -1208,7 +2212,10 @@ The script will automatically try methods in order until one succeeds.
             use_playwright=not args.no_playwright and args.method != 'requests',
             visible_browser=args.visible_browser,
             search_query=args.search,
-            output_dir=args.output
+            output_dir=args.output,
+            queries_file=args.queries_file,
+            concurrency=args.concurrency,
+            browser_profile=args.browser_profile
         )
     except Exception as e:
         print(f"{Fore.RED}Unhandled exception: {e}{Style.RESET_ALL}")
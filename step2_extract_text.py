@@ -60,6 +60,10 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+# Write buffer for extracted output files: large enough that a typical
+# report is flushed in a few writes, without holding a second full copy
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 # Configure logging
 def setup_logging(verbose: bool = False) -> None:
@@ -447,39 +451,39 @@ def save_extracted_text(result: Dict, output_dir: Path, format: str = 'txt') ->
     saved_files = []
     
     try:
-        # Save as TXT
+        # Save as TXT (parts are streamed through a large buffer rather than
+        # joined, so the page text is never copied into one big string)
         if format in ('txt', 'both'):
             txt_path = output_dir / f"{base_name}.txt"
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                # Write metadata header
-                f.write("=" * 80 + "\n")
-                f.write(f"PDF: {pdf_path.name}\n")
-                f.write(f"Pages: {result['total_pages']}\n")
-                if result['metadata']:
-                    f.write(f"Title: {result['metadata'].get('Title', 'N/A')}\n")
-                    f.write(f"Author: {result['metadata'].get('Author', 'N/A')}\n")
-                    f.write(f"Subject: {result['metadata'].get('Subject', 'N/A')}\n")
-                f.write("=" * 80 + "\n\n")
+            
+            # Metadata header
+            parts = ["=" * 80 + "\n", f"PDF: {pdf_path.name}\n", f"Pages: {result['total_pages']}\n"]
+            if result['metadata']:
+                parts.append(f"Title: {result['metadata'].get('Title', 'N/A')}\n")
+                parts.append(f"Author: {result['metadata'].get('Author', 'N/A')}\n")
+                parts.append(f"Subject: {result['metadata'].get('Subject', 'N/A')}\n")
+            parts.append("=" * 80 + "\n\n")
+            
+            # Page content
+            for page in result['pages']:
+                parts.append(f"\n{'='*80}\nPAGE {page['page_number']}\n{'='*80}\n\n")
                 
-                # Write page content
-                for page in result['pages']:
-                    f.write(f"\n{'='*80}\n")
-                    f.write(f"PAGE {page['page_number']}\n")
-                    f.write(f"{'='*80}\n\n")
-                    
-                    if page['text']:
-                        f.write(page['text'])
-                        f.write("\n\n")
-                    
-                    # Write tables
-                    if page['tables']:
-                        f.write(f"\n--- TABLES ON PAGE {page['page_number']} ---\n\n")
-                        for table_idx, table in enumerate(page['tables'], 1):
-                            f.write(f"Table {table_idx}:\n")
-                            # Simple table formatting
-                            for row in table:
-                                f.write(" | ".join(row) + "\n")
-                            f.write("\n")
+                if page['text']:
+                    parts.append(page['text'])
+                    parts.append("\n\n")
+                
+                # Tables
+                if page['tables']:
+                    parts.append(f"\n--- TABLES ON PAGE {page['page_number']} ---\n\n")
+                    for table_idx, table in enumerate(page['tables'], 1):
+                        parts.append(f"Table {table_idx}:\n")
+                        # Simple table formatting
+                        for row in table:
+                            parts.append(" | ".join(row) + "\n")
+                        parts.append("\n")
+            
+            with open(txt_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.writelines(parts)
             
             saved_files.append(txt_path)
             logging.debug(f"Saved TXT: {txt_path}")
@@ -487,8 +491,10 @@ def save_extracted_text(result: Dict, output_dir: Path, format: str = 'txt') ->
         # Save as JSON
         if format in ('json', 'both'):
             json_path = output_dir / f"{base_name}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            # Stream the encoder's chunks instead of materializing the whole document
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            with open(json_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.writelines(encoder.iterencode(result))
             
             saved_files.append(json_path)
             logging.debug(f"Saved JSON: {json_path}")
@@ -895,8 +901,10 @@ Performance tips:
         logging.error(f"Number of workers must be at least 1")
         sys.exit(1)
     
+    # Extraction waits on disk as well as CPU, so some oversubscription
+    # (the coordinator uses 1.5x) is deliberate; only warn beyond that
     cpu_count = mp.cpu_count()
-    if args.workers > cpu_count:
+    if args.workers > 2 * cpu_count:
         logging.warning(f"Requested {args.workers} workers but only {cpu_count} CPUs available")
     
     # Validate input directory